@@ -21,33 +21,52 @@
 # ======================================================
 
 import os
+import re
 import sys
+import bisect
+import heapq
 import time
 import json
 import uuid
+import secrets
+import random
 import hashlib
+import hmac
 import threading
+import itertools
+import functools
+import atexit
+import contextlib
 import importlib.util
-import copy
 import traceback
 import shutil
-from queue import PriorityQueue
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
+from collections import Counter, deque, namedtuple
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Tuple, Optional
 
 import gradio as gr
+try:
+    import orjson  # acelerador opcional (viene con gradio); fallback a json stdlib
+except ImportError:
+    orjson = None
+try:
+    import blake3  # hash SIMD opcional para checksums de replicas
+except ImportError:
+    blake3 = None
+
 from plugins.adapters import Adapters
 from core.orchestrator import Orchestrator
 from plugins.aether_core import ensure_orchestrator_autostart
 
 
 SUPPORTED_LANGS = ("es", "en", "pt-BR", "pt-PT")
-LANGUAGE_CHOICES = [
+LANGUAGE_CHOICES = (
     ("Español", "es"),
     ("English", "en"),
     ("Português (Brasil)", "pt-BR"),
     ("Português (Portugal)", "pt-PT"),
-]
+)
 LANG = {
     "es": {
         "app_title": "AETHER CORE — HF SAFE",
@@ -370,6 +389,14 @@ LANG = {
     },
 }
 
+# Flat lookup table: every supported language carries every key (missing ones filled
+# from "es"), so t() is a single subscript with no fallback branch. Values are interned
+# so the texts shared between languages / views are one object.
+LANG_FLAT: Dict[str, Dict[str, str]] = {
+    code: {k: sys.intern(v) for k, v in {**LANG["es"], **LANG.get(code, {})}.items()}
+    for code in SUPPORTED_LANGS
+}
+
 
 def normalize_lang(lang: Optional[str]) -> str:
     if not lang:
@@ -389,6 +416,8 @@ def normalize_lang(lang: Optional[str]) -> str:
     return "es"
 
 
+# Few distinct Accept-Language strings in practice; resolution is pure.
+@functools.lru_cache(maxsize=512)
 def detect_language_from_header(accept_language: Optional[str]) -> str:
     if not accept_language:
         return "es"
@@ -402,17 +431,49 @@ def detect_language_from_header(accept_language: Optional[str]) -> str:
     return "es"
 
 
+# LANG is static (no hot reload): (lang, key) -> text never changes, so memoize it.
+@functools.lru_cache(maxsize=4096)
 def t(lang: str, key: str) -> str:
-    resolved = normalize_lang(lang)
-    return LANG.get(resolved, LANG["es"]).get(key, LANG["es"].get(key, key))
+    return LANG_FLAT[normalize_lang(lang)].get(key, key)
 
 # -----------------------------
 # TIME (timezone-aware)
 # -----------------------------
 
+# Inside now_scope() every safe_now() of the thread returns the same timestamp, so
+# one task trace (log events, memory entry, state) shares a single time.
+_NOW_CACHE = threading.local()
+
 def safe_now() -> str:
+    cached = getattr(_NOW_CACHE, "value", None)
+    if cached is not None:
+        return cached
     return datetime.now(timezone.utc).isoformat()
 
+@contextlib.contextmanager
+def now_scope():
+    if getattr(_NOW_CACHE, "value", None) is not None:
+        # nested: keep the outer scope's timestamp
+        yield
+        return
+    _NOW_CACHE.value = datetime.now(timezone.utc).isoformat()
+    try:
+        yield
+    finally:
+        _NOW_CACHE.value = None
+
+def now_scope_advance() -> None:
+    # after a blocking step (task execution) move the scope's timestamp forward
+    if getattr(_NOW_CACHE, "value", None) is not None:
+        _NOW_CACHE.value = datetime.now(timezone.utc).isoformat()
+
+def _now_scoped(fn):
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with now_scope():
+            return fn(*args, **kwargs)
+    return wrapper
+
 # -----------------------------
 # ENV HELPERS
 # -----------------------------
@@ -431,17 +492,39 @@ def env_bool(name: str, default: bool = False) -> bool:
 def get_bool_env(name: str, default: bool = False) -> bool:
     return env_bool(name, default)
 
-def sha256_text(s: str) -> str:
+def _sha256_text_uncached(s: str) -> str:
     return hashlib.sha256((s or "").encode("utf-8")).hexdigest()
 
+SHA256_TEXT_CACHE_MAX_LEN = 4096
+
+@functools.lru_cache(maxsize=4096)
+def _sha256_text_cached(s: str) -> str:
+    return _sha256_text_uncached(s)
+
+def sha256_text(s: str) -> str:
+    # short, repeated inputs are memoized; large ones (bundles) bypass the cache so
+    # it never pins megabyte strings
+    if s and len(s) > SHA256_TEXT_CACHE_MAX_LEN:
+        return _sha256_text_uncached(s)
+    return _sha256_text_cached(s or "")
+
 ALLOW_NETWORK = (os.environ.get("AETHER_ALLOW_NETWORK", "1") == "1") and not os.environ.get(
     "AETHER_SANDBOX_DIR"
 )
 
+_DIRS_OK: set = set()
+
+def _ensure_dir(d: str, force: bool = False) -> None:
+    # makedirs once per directory; writers pass force=True after a FileNotFoundError
+    # (directory removed underneath us) and retry.
+    if force or d not in _DIRS_OK:
+        os.makedirs(d, exist_ok=True)
+        _DIRS_OK.add(d)
+
 def ensure_dirs() -> None:
-    os.makedirs(DATA_DIR, exist_ok=True)
-    os.makedirs(MODULES_DIR, exist_ok=True)
-    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    _ensure_dir(DATA_DIR, force=True)
+    _ensure_dir(MODULES_DIR, force=True)
+    _ensure_dir(SNAPSHOT_DIR, force=True)
 
 # -----------------------------
 # PATHS (HF-safe)
@@ -470,6 +553,10 @@ EVENTS_LOG_FILE = os.path.join(DATA_DIR, "events.log")
 DEMO1_FILE = os.path.join(DATA_DIR, "demo1.json")
 PROJECTS_FILE = os.path.join(DATA_DIR, "projects.json")
 TASKS_FILE = os.path.join(DATA_DIR, "tasks.json")
+PROJECTS_LOG_FILE = PROJECTS_FILE + ".log"
+TASKS_LOG_FILE = TASKS_FILE + ".log"
+MEMORY_LOG_FILE = MEMORY_FILE + ".log"
+LOGS_LOG_FILE = LOG_FILE + ".log"
 
 # -----------------------------
 # LIMITS
@@ -502,6 +589,7 @@ AETHER_TASK_BUDGET_MAX = int(os.environ.get("AETHER_TASK_BUDGET_MAX", str(max(1,
 # TASK SECURITY (v40-v42)
 # -----------------------------
 AETHER_TASK_SECRET = os.environ.get("AETHER_TASK_SECRET", "")
+AETHER_TASK_SECRET_BYTES = AETHER_TASK_SECRET.encode("utf-8")  # HMAC key, encoded once
 
 PERMISSIONS = {
     "read_only": {"manual": True, "auto": True},
@@ -548,6 +636,7 @@ TRUST_ZONE_POLICIES = {
     },
 }
 
+@functools.lru_cache(maxsize=256)
 def resolve_zone(source: str, origin: Optional[str]) -> str:
     src = (source or "").strip().lower()
     org = (origin or "").strip().lower()
@@ -651,18 +740,18 @@ def _trust_zone_allowed(zone: str, task_type: str, command: str) -> Tuple[bool,
 def _summarize_trust_zone_blocks() -> Dict[str, Any]:
     counts = {z: 0 for z in TRUST_ZONES}
     total = 0
+    # scan newest-first in place under the lock instead of copying the whole log
     with log_lock:
-        entries = list(AETHER_LOGS)
-    for entry in reversed(entries):
-        if total >= TRUST_ZONE_BLOCK_WINDOW:
-            break
-        if entry.get("type") not in {"TRUST_ZONE_BLOCK_ENQUEUE", "TRUST_ZONE_BLOCK_EXEC"}:
-            continue
-        info = entry.get("info", {})
-        zone = info.get("zone")
-        if zone in counts:
-            counts[zone] += 1
-        total += 1
+        for entry in reversed(AETHER_LOGS):
+            if total >= TRUST_ZONE_BLOCK_WINDOW:
+                break
+            if entry.get("type") not in {"TRUST_ZONE_BLOCK_ENQUEUE", "TRUST_ZONE_BLOCK_EXEC"}:
+                continue
+            info = entry.get("info", {})
+            zone = info.get("zone")
+            if zone in counts:
+                counts[zone] += 1
+            total += 1
     return {"window": TRUST_ZONE_BLOCK_WINDOW, "total": total, "by_zone": counts}
 
 def _trust_zone_policy_snapshot() -> Dict[str, Any]:
@@ -678,23 +767,21 @@ def _collect_recent_errors(max_items: int = 8) -> List[Dict[str, Any]]:
     # Deterministic error sampling: newest-first with fixed cap, no side effects.
     recent: List[Dict[str, Any]] = []
     with log_lock:
-        entries = list(AETHER_LOGS)
-    for entry in reversed(entries):
-        if len(recent) >= max_items:
-            break
-        if entry.get("type") in THROTTLE_ERROR_TYPES:
-            recent.append(entry)
+        for entry in reversed(AETHER_LOGS):
+            if len(recent) >= max_items:
+                break
+            if entry.get("type") in THROTTLE_ERROR_TYPES:
+                recent.append(entry)
     return recent
 
 def _collect_recent_trust_zone_blocks(max_items: int = 8) -> List[Dict[str, Any]]:
     recent: List[Dict[str, Any]] = []
     with log_lock:
-        entries = list(AETHER_LOGS)
-    for entry in reversed(entries):
-        if len(recent) >= max_items:
-            break
-        if entry.get("type") in {"TRUST_ZONE_BLOCK_ENQUEUE", "TRUST_ZONE_BLOCK_EXEC"}:
-            recent.append(entry)
+        for entry in reversed(AETHER_LOGS):
+            if len(recent) >= max_items:
+                break
+            if entry.get("type") in {"TRUST_ZONE_BLOCK_ENQUEUE", "TRUST_ZONE_BLOCK_EXEC"}:
+                recent.append(entry)
     return recent
 
 def diagnose_system() -> Dict[str, Any]:
@@ -709,11 +796,11 @@ def diagnose_system() -> Dict[str, Any]:
 
     safe_mode = dict(SAFE_MODE)
     freeze_state = dict(FREEZE_STATE)
-    queue_size = int(TASK_QUEUE.qsize())
+    queue_size = int(task_queue_size())
     energy = int(state_snapshot.get("energy", 0))
     last_cycle = state_snapshot.get("last_cycle")
     now_ts = time.time()
-    last_cycle_ts = _parse_iso_ts(last_cycle)
+    last_cycle_ts = _entry_epoch(state_snapshot, "last_cycle_ts", "last_cycle")
     watchdog_limit = max(0, int(AETHER_WATCHDOG_SEC))
     watchdog_grace = max(0, int(AETHER_WATCHDOG_GRACE_SEC))
 
@@ -797,12 +884,11 @@ def diagnose_system() -> Dict[str, Any]:
     # Policy violations inferred from permission denials.
     policy_denied = 0
     with log_lock:
-        entries = list(AETHER_LOGS)
-    for entry in reversed(entries):
-        if entry.get("type") == "TASK_PERMISSION_DENIED":
-            policy_denied += 1
-            if policy_denied >= 3:
-                break
+        for entry in reversed(AETHER_LOGS):
+            if entry.get("type") == "TASK_PERMISSION_DENIED":
+                policy_denied += 1
+                if policy_denied >= 3:
+                    break
     if policy_denied:
         issues.append(
             {
@@ -816,14 +902,15 @@ def diagnose_system() -> Dict[str, Any]:
     # Task timeouts and IO instability signals.
     timeout_count = 0
     io_errors = 0
-    for entry in reversed(entries):
-        etype = entry.get("type")
-        if etype == "TASK_TIMEOUT":
-            timeout_count += 1
-        if etype == "JSON_WRITE_ERROR":
-            io_errors += 1
-        if timeout_count >= 3 and io_errors >= 3:
-            break
+    with log_lock:
+        for entry in reversed(AETHER_LOGS):
+            etype = entry.get("type")
+            if etype == "TASK_TIMEOUT":
+                timeout_count += 1
+            if etype == "JSON_WRITE_ERROR":
+                io_errors += 1
+            if timeout_count >= 3 and io_errors >= 3:
+                break
     if timeout_count:
         issues.append(
             {
@@ -880,9 +967,30 @@ def diagnose_system() -> Dict[str, Any]:
         "issues": issues_sorted,
     }
 
-def get_self_diagnosis() -> Dict[str, Any]:
-    # Wrapper to allow future expansion without changing callers.
-    return diagnose_system()
+# diagnose_system walks logs/tasks/memory; ui_status and evaluate_stability call it on
+# every poll, so reuse the last result for DIAGNOSIS_TTL_SEC. The key drops the cache at
+# once on safe mode / freeze / kill switch transitions (DIAGNOSIS_VERSION bump).
+DIAGNOSIS_TTL_SEC = float(os.environ.get("AETHER_DIAGNOSIS_TTL_SEC", "1.0"))
+DIAGNOSIS_VERSION = [0]
+_DIAGNOSIS_CACHE: Dict[str, Any] = {"key": None, "ts": 0.0, "val": None}
+_diagnosis_cache_lock = threading.Lock()
+
+def _bump_diagnosis_version() -> None:
+    with _diagnosis_cache_lock:
+        DIAGNOSIS_VERSION[0] += 1
+
+def get_self_diagnosis(fresh: bool = False) -> Dict[str, Any]:
+    # Shared result: callers only read/serialize it. fresh=True (explicit user request)
+    # always re-runs diagnose_system and refreshes the cache for the pollers.
+    key = (DIAGNOSIS_VERSION[0], safe_mode_enabled(), PAUSED, KILL_SWITCH.get("status"))
+    now_m = time.monotonic()
+    with _diagnosis_cache_lock:
+        if not fresh and _DIAGNOSIS_CACHE["key"] == key and now_m - _DIAGNOSIS_CACHE["ts"] < DIAGNOSIS_TTL_SEC:
+            return _DIAGNOSIS_CACHE["val"]
+    val = diagnose_system()
+    with _diagnosis_cache_lock:
+        _DIAGNOSIS_CACHE.update({"key": key, "ts": now_m, "val": val})
+    return val
 
 def _diagnosis_summary(diagnosis: Dict[str, Any]) -> Dict[str, Any]:
     issues = diagnosis.get("issues") if isinstance(diagnosis, dict) else []
@@ -907,12 +1015,11 @@ STABILITY_STATE = {"mode": "NORMAL", "since": safe_now(), "reasons": []}
 def _recent_recovery_count(max_items: int = 10) -> int:
     count = 0
     with log_lock:
-        entries = list(AETHER_LOGS)
-    for entry in reversed(entries):
-        if count >= max_items:
-            break
-        if entry.get("type") == "RECOVERY_EVENT":
-            count += 1
+        for entry in reversed(AETHER_LOGS):
+            if count >= max_items:
+                break
+            if entry.get("type") == "RECOVERY_EVENT":
+                count += 1
     return count
 
 def evaluate_stability() -> Dict[str, Any]:
@@ -968,6 +1075,8 @@ SAFE_MODE_LOGGED = False
 # FREEZE + POLICY
 # -----------------------------
 PAUSED = get_bool_env("AETHER_FREEZE_MODE", default=False)
+# Full tracebacks in error events only when debugging (keeps the log small).
+AETHER_DEBUG = get_bool_env("AETHER_DEBUG", default=False)
 AETHER_ORCHESTRATOR_ALLOW_RUN = env_bool("AETHER_ORCHESTRATOR_ALLOW_RUN", True)
 
 ROOT_GOAL = "EXECUTE_USER_COMMANDS_ONLY"
@@ -988,7 +1097,6 @@ log_lock = threading.Lock()
 state_lock = threading.Lock()
 strategic_lock = threading.Lock()
 modules_lock = threading.Lock()
-dedup_lock = threading.Lock()
 queue_lock = threading.Lock()
 projects_lock = threading.Lock()
 tasks_lock = threading.Lock()
@@ -1040,6 +1148,14 @@ IO_WRITE_COALESCE_DELAY_SEC = 0.0
 
 _path_state_lock = threading.Lock()
 _path_states: Dict[str, Dict[str, Any]] = {}
+# Orden global de escrituras: un payload capturado antes nunca pisa uno posterior.
+_write_seq = itertools.count(1)
+# Bumped on every persisted/dirty-marked change; ui_status() reuses its payload while it holds.
+_status_seq = itertools.count(1)
+STATUS_VERSION = [0]
+
+def _bump_status_version() -> None:
+    STATUS_VERSION[0] = next(_status_seq)
 
 def _get_path_state(path: str) -> Dict[str, Any]:
     abs_path = os.path.abspath(path)
@@ -1052,19 +1168,75 @@ def _get_path_state(path: str) -> Dict[str, Any]:
                 "pending_data": None,
                 "fail_count": 0,
                 "backoff_until": 0.0,
+                "last_seq": 0,
+                "last_written": None,
             }
             _path_states[abs_path] = state
         return state
 
+def _json_loads(txt: Any) -> Any:
+    if orjson is not None:
+        return orjson.loads(txt)
+    return json.loads(txt)
+
+# Encoders prebuilt once: json.dumps() with non-default kwargs builds a new one per call.
+_UI_ENCODE = json.JSONEncoder(indent=2, ensure_ascii=False, sort_keys=False).encode
+_UI_ENCODE_SORTED = json.JSONEncoder(indent=2, ensure_ascii=False, sort_keys=True).encode
+_COMPACT_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+# task signatures: must stay byte-stable, so always the stdlib encoder
+_CANON_ENCODE = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode
+
+def _json_dumps_pretty(obj: Any, sort_keys: bool = False) -> str:
+    # Same layout as json.dumps(indent=2, ensure_ascii=False); orjson when available.
+    if orjson is not None:
+        opt = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            opt |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=opt).decode("utf-8")
+        except TypeError:
+            pass
+    return _UI_ENCODE_SORTED(obj) if sort_keys else _UI_ENCODE(obj)
+
+def _json_dumps_pretty_bytes(obj: Any, sort_keys: bool = False) -> bytes:
+    # Same text as _json_dumps_pretty, as UTF-8 bytes (hash without a str round trip).
+    if orjson is not None:
+        opt = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            opt |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(obj, option=opt)
+        except TypeError:
+            pass
+    return (_UI_ENCODE_SORTED(obj) if sort_keys else _UI_ENCODE(obj)).encode("utf-8")
+
+def _json_dumps_line(obj: Any) -> str:
+    # Compact single-line JSON (UI status lines); orjson when available.
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass
+    return _COMPACT_ENCODE(obj)
+
+def _read_json_bytes(path: str) -> Optional[bytes]:
+    # Raw bytes straight into the parser: no decoded str copy and no strip() copy
+    # (both parsers accept UTF-8 bytes and surrounding whitespace), which roughly
+    # halves peak memory when loading large snapshots.
+    with open(path, "rb") as f:
+        raw = f.read()
+    if not raw or raw.isspace():
+        return None
+    return raw
+
 def load_json(path: str, default: Any) -> Any:
     try:
         if not os.path.exists(path):
             return default
-        with open(path, "r", encoding="utf-8") as f:
-            txt = f.read().strip()
-            if not txt:
-                return default
-            return json.loads(txt)
+        raw = _read_json_bytes(path)
+        if raw is None:
+            return default
+        return _json_loads(raw)
     except Exception:
         return default
 
@@ -1072,23 +1244,34 @@ def safe_json_load(path: str, default: Any = None) -> Any:
     try:
         if not os.path.exists(path):
             return default
-        with open(path, "r", encoding="utf-8") as f:
-            raw = f.read().strip()
-        if not raw:
+        raw = _read_json_bytes(path)
+        if raw is None:
             return default
-        return json.loads(raw)
+        return _json_loads(raw)
     except Exception:
         return default
 
-def save_json_atomic(path: str, data: Any) -> bool:
+class _JSONText(str):
+    # Payload ya serializado (cola de escritura en background): se escribe tal cual.
+    pass
+
+def save_json_atomic(path: str, data: Any, _seq: Optional[int] = None, fsync: bool = False) -> bool:
+    # fsync is opt-in: os.replace already makes the swap atomic; only durability-critical
+    # writers (snapshots, background flushers) pay for the flush to disk.
+    seq = _seq if _seq is not None else next(_write_seq)
+    _bump_status_version()
     d = os.path.dirname(path) or "."
-    os.makedirs(d, exist_ok=True)
+    _ensure_dir(d)
 
     base = os.path.basename(path)
     tmp = os.path.join(d, f".{base}.{uuid.uuid4().hex}.tmp")
     state = _get_path_state(path)
 
     with state["lock"]:
+        if seq < state["last_seq"]:
+            # A newer payload for this path was already accepted.
+            return True
+        state["last_seq"] = seq
         if state["in_progress"]:
             # Prefer last-writer-wins to avoid overlapping writes from threads.
             state["pending_data"] = data
@@ -1097,14 +1280,37 @@ def save_json_atomic(path: str, data: Any) -> bool:
 
     def _write_once(payload: Any) -> bool:
         try:
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2, ensure_ascii=False)
-                f.flush()
+            text = payload if isinstance(payload, _JSONText) else _json_dumps_pretty(payload)
+            raw = text.encode("utf-8")
+            digest = hashlib.blake2b(raw, digest_size=16).digest()
+            # Unchanged payload and the file is still the one we wrote -> skip the rewrite + fsync.
+            last = state.get("last_written")
+            if last is not None and last[0] == digest:
                 try:
-                    os.fsync(f.fileno())
-                except Exception:
+                    st = os.stat(path)
+                    if (st.st_size, st.st_mtime_ns) == last[1:]:
+                        return True
+                except OSError:
                     pass
+            try:
+                f = open(tmp, "wb")
+            except FileNotFoundError:
+                _ensure_dir(d, force=True)
+                f = open(tmp, "wb")
+            with f:
+                f.write(raw)
+                f.flush()
+                if fsync:
+                    try:
+                        os.fsync(f.fileno())
+                    except Exception:
+                        pass
             os.replace(tmp, path)
+            try:
+                st = os.stat(path)
+                state["last_written"] = (digest, st.st_size, st.st_mtime_ns)
+            except OSError:
+                state["last_written"] = None
             return True
         except Exception as e:
             try:
@@ -1158,6 +1364,469 @@ def save_json_atomic(path: str, data: Any) -> bool:
             time.sleep(IO_WRITE_COALESCE_DELAY_SEC)
     return ok
 
+def _fsync_path(p: str) -> bool:
+    try:
+        fd = os.open(p, os.O_RDONLY)
+    except Exception:
+        return False
+    try:
+        os.fsync(fd)
+        return True
+    except Exception:
+        return False
+    finally:
+        os.close(fd)
+
+def _fsync_dir(d: str) -> None:
+    _fsync_path(d)
+
+BATCH_FSYNC_WORKERS = 8
+
+def save_json_atomic_batch(pairs: List[Tuple[Any, ...]], fsync: bool = True, sync_dirs: bool = True) -> bool:
+    # Multi-file commit: stage every tmp file first (buffered, no sync), fsync all of
+    # them concurrently so the filesystem can fold them into one journal commit, then
+    # rename in one pass and fsync each parent directory once. sync_dirs=False keeps the
+    # tmp fsyncs but skips the directory syncs (the caller flushes once for the batch);
+    # fsync=False skips all syncing.
+    # Items are (path, data) or (path, data, seq); callers pass next(_write_seq) taken
+    # under the owning lock. Each path joins save_json_atomic's ordering: queued async
+    # payloads it supersedes are dropped, a write already running for the path hands
+    # off to it, and nothing older can land after it.
+    claimed: List[Tuple[str, Any, int]] = []
+    superseded: List[Any] = []
+    for item in pairs:
+        path, data = item[0], item[1]
+        seq = item[2] if len(item) > 2 else next(_write_seq)
+        with _async_write_cond:
+            queued = _ASYNC_WRITES.get(path)
+            if queued is not None and queued[0] < seq:
+                del _ASYNC_WRITES[path]
+                superseded.extend(queued[2])
+        state = _get_path_state(path)
+        with state["lock"]:
+            if seq < state["last_seq"]:
+                # A newer payload for this path was already accepted.
+                continue
+            state["last_seq"] = seq
+            if state["in_progress"]:
+                # the running writer picks this up right after its current write
+                state["pending_data"] = data
+                continue
+            state["in_progress"] = True
+            state["last_written"] = None
+        claimed.append((path, data, seq))
+
+    staged: List[Tuple[str, str]] = []
+    failed: List[Tuple[str, Any, int]] = []
+    ok = True
+    for path, data, seq in claimed:
+        d = os.path.dirname(path) or "."
+        tmp = os.path.join(d, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+        try:
+            _ensure_dir(d)
+            try:
+                f = open(tmp, "w", encoding="utf-8")
+            except FileNotFoundError:
+                _ensure_dir(d, force=True)
+                f = open(tmp, "w", encoding="utf-8")
+            with f:
+                f.write(data if isinstance(data, _JSONText) else _json_dumps_pretty(data))
+            staged.append((tmp, path))
+        except Exception:
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+            failed.append((path, data, seq))
+
+    if fsync and staged:
+        tmps = [tmp for tmp, _ in staged]
+        if len(tmps) > 1:
+            with ThreadPoolExecutor(max_workers=min(BATCH_FSYNC_WORKERS, len(tmps))) as pool:
+                synced = list(pool.map(_fsync_path, tmps))
+        else:
+            synced = [_fsync_path(tmps[0])]
+        if not all(synced):
+            by_path = {path: (data, seq) for path, data, seq in claimed}
+            keep: List[Tuple[str, str]] = []
+            for (tmp, path), s in zip(staged, synced):
+                if s:
+                    keep.append((tmp, path))
+                    continue
+                try:
+                    os.remove(tmp)
+                except Exception:
+                    pass
+                failed.append((path,) + by_path[path])
+            staged = keep
+
+    dirs = set()
+    for tmp, path in staged:
+        try:
+            os.replace(tmp, path)
+            dirs.add(os.path.dirname(path) or ".")
+        except Exception as e:
+            ok = False
+            try:
+                if os.path.exists(tmp):
+                    os.remove(tmp)
+            except Exception:
+                pass
+            if "LOG_FILE" in globals() and path != LOG_FILE and "log_event" in globals():
+                try:
+                    log_event("JSON_WRITE_ERROR", {"file": path, "error": str(e)})
+                except Exception:
+                    pass
+    if fsync and sync_dirs:
+        for d in sorted(dirs):
+            _fsync_dir(d)
+
+    # release the claims; payloads handed over meanwhile are written now
+    for path, _, _ in claimed:
+        state = _get_path_state(path)
+        with state["lock"]:
+            pending = state.get("pending_data")
+            state["pending_data"] = None
+            state["in_progress"] = False
+            last_seq = state["last_seq"]
+        if pending is not None:
+            ok = save_json_atomic(path, pending, _seq=last_seq, fsync=fsync) and ok
+
+    for path, data, seq in failed:
+        # Fall back to the single-file writer (backoff + error logging).
+        ok = save_json_atomic(path, data, _seq=seq, fsync=fsync) and ok
+
+    for cb in superseded:
+        try:
+            cb(ok)
+        except Exception:
+            pass
+    return ok
+
+# -----------------------------
+# ASYNC WRITER (background persistence)
+# -----------------------------
+
+_async_write_cond = threading.Condition()
+_ASYNC_WRITES: Dict[str, Tuple[int, "_JSONText", List[Any]]] = {}  # path -> (seq, text, on_done); same-path writes coalesce
+_async_write_state: Dict[str, Any] = {"inflight": 0, "thread": None}
+
+def _async_writer_loop() -> None:
+    while True:
+        with _async_write_cond:
+            while not _ASYNC_WRITES:
+                _async_write_cond.wait()
+            batch = list(_ASYNC_WRITES.items())
+            _ASYNC_WRITES.clear()
+            _async_write_state["inflight"] = len(batch)
+        for path, (seq, text, callbacks) in batch:
+            try:
+                ok = save_json_atomic(path, text, _seq=seq, fsync=True)
+            except Exception:
+                ok = False
+            for cb in callbacks:
+                try:
+                    cb(ok)
+                except Exception:
+                    pass
+        with _async_write_cond:
+            _async_write_state["inflight"] = 0
+            _async_write_cond.notify_all()
+
+def save_json_atomic_async(path: str, data: Any, on_done: Optional[Any] = None) -> bool:
+    # Serialize now (caller usually holds the owning lock), write + fsync on the writer thread.
+    # on_done(ok) runs after the write that covers this payload (a coalesced newer one counts).
+    try:
+        text = _JSONText(_json_dumps_pretty(data))
+    except Exception:
+        ok = save_json_atomic(path, data)
+        if on_done is not None:
+            on_done(ok)
+        return ok
+    with _async_write_cond:
+        prev = _ASYNC_WRITES.get(path)
+        callbacks = list(prev[2]) if prev else []
+        if on_done is not None:
+            callbacks.append(on_done)
+        _ASYNC_WRITES[path] = (next(_write_seq), text, callbacks)
+        th = _async_write_state.get("thread")
+        if th is None or not th.is_alive():
+            th = threading.Thread(target=_async_writer_loop, daemon=True)
+            _async_write_state["thread"] = th
+            th.start()
+        _async_write_cond.notify_all()
+    return True
+
+def flush_pending_writes(timeout: float = 5.0) -> bool:
+    deadline = time.time() + max(0.0, float(timeout))
+    with _async_write_cond:
+        while _ASYNC_WRITES or _async_write_state["inflight"]:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            _async_write_cond.wait(remaining)
+    return True
+
+atexit.register(flush_pending_writes)
+
+# -----------------------------
+# DIRTY FILES (write coalescing for hot loops)
+# -----------------------------
+# Hot paths mark a file dirty with a reference to the live object; the worker and
+# scheduler flush once per tick, and a background flusher drains anything left at most
+# every AETHER_WRITE_FLUSH_MS (last writer wins per file). Readers keep using the
+# in-memory globals.
+
+DIRTY_FILES: Dict[str, Tuple[Any, float]] = {}
+dirty_lock = threading.Lock()
+WRITE_FLUSH_SEC = max(0.01, int(os.environ.get("AETHER_WRITE_FLUSH_MS", "250")) / 1000.0)
+DIRTY_EVENT = threading.Event()
+_dirty_flusher_state: Dict[str, Any] = {"thread": None}
+
+def _dirty_flusher_loop() -> None:
+    while True:
+        DIRTY_EVENT.wait()
+        # coalesce a burst of marks into one write per file
+        time.sleep(WRITE_FLUSH_SEC)
+        DIRTY_EVENT.clear()
+        try:
+            flush_dirty()
+        except Exception:
+            pass
+
+def _dirty_owner_lock(path: str) -> Optional[Any]:
+    return {
+        STATE_FILE: state_lock,
+        MEMORY_FILE: memory_lock,
+        STRATEGIC_FILE: strategic_lock,
+        TASKS_FILE: tasks_lock,
+        PROJECTS_FILE: projects_lock,
+    }.get(path)
+
+def mark_dirty(path: str, obj: Any) -> None:
+    _bump_status_version()
+    with dirty_lock:
+        prev = DIRTY_FILES.get(path)
+        DIRTY_FILES[path] = (obj, prev[1] if prev else time.time())
+        th = _dirty_flusher_state.get("thread")
+        if th is None or not th.is_alive():
+            th = threading.Thread(target=_dirty_flusher_loop, daemon=True)
+            _dirty_flusher_state["thread"] = th
+            th.start()
+    DIRTY_EVENT.set()
+
+def flush_dirty() -> None:
+    with dirty_lock:
+        if not DIRTY_FILES:
+            return
+        items = list(DIRTY_FILES.items())
+        DIRTY_FILES.clear()
+    for path, (obj, _) in items:
+        owner = _dirty_owner_lock(path)
+        try:
+            # Serialize under the owning lock so the live object can't change mid-dump.
+            if owner is not None:
+                with owner:
+                    seq = next(_write_seq)
+                    text = _JSONText(_json_dumps_pretty(obj))
+            else:
+                seq = next(_write_seq)
+                text = _JSONText(_json_dumps_pretty(obj))
+            save_json_atomic(path, text, _seq=seq, fsync=True)
+        except Exception:
+            save_json_atomic(path, obj, fsync=True)
+
+atexit.register(flush_dirty)
+
+# -----------------------------
+# APPEND-ONLY JSONL (projects/tasks/memory)
+# -----------------------------
+# add_project/add_task and memory events append one line instead of rewriting the whole list.
+# Base JSON files stay valid (plugins read them); startup replays base + logs.
+
+JSONL_COMPACT_EVERY = int(os.environ.get("AETHER_JSONL_COMPACT_EVERY", "200"))
+_jsonl_counts: Dict[str, int] = {}
+# log_path -> base_path of a compaction whose base-file write is still queued
+_jsonl_compacting: Dict[str, str] = {}
+# bumped by _jsonl_reset: a compaction started before the reset no longer owns `.old`
+_jsonl_gen: Dict[str, int] = {}
+
+# One O_APPEND fd per journal, opened on first append and kept for the process lifetime.
+# Every path that renames or removes a journal (compaction, reset) closes it first, all
+# under the journal's owning lock, so the next append reopens the new file.
+_JSONL_FDS: Dict[str, int] = {}
+_jsonl_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+def _jsonl_close(path: str) -> None:
+    fd = _JSONL_FDS.pop(path, None)
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+def _jsonl_fd(path: str) -> int:
+    fd = _JSONL_FDS.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        _JSONL_FDS[path] = fd
+    return fd
+
+def _jsonl_append(path: str, entry: Dict[str, Any], fsync: bool = True) -> bool:
+    try:
+        line = (_json_dumps_line(entry) + "\n").encode("utf-8")
+        try:
+            fd = _jsonl_fd(path)
+            os.write(fd, line)
+        except OSError:
+            # stale fd (file/dir removed underneath us): reopen once
+            _jsonl_close(path)
+            _ensure_dir(os.path.dirname(path) or ".", force=True)
+            fd = _jsonl_fd(path)
+            os.write(fd, line)
+        if fsync:
+            try:
+                _jsonl_fdatasync(fd)
+            except Exception:
+                pass
+        _jsonl_counts[path] = _jsonl_counts.get(path, 0) + 1
+        return True
+    except Exception as e:
+        # the event log's own journal cannot report through log_event (log_lock is held)
+        if "log_event" in globals() and path != LOGS_LOG_FILE:
+            try:
+                log_event("JSONL_APPEND_ERROR", {"file": path, "error": str(e)})
+            except Exception:
+                pass
+        return False
+
+def _jsonl_read(path: str) -> List[Dict[str, Any]]:
+    out: List[Dict[str, Any]] = []
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = _json_loads(line)
+                except Exception:
+                    continue  # linea truncada por crash
+                if isinstance(item, dict):
+                    out.append(item)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        pass
+    return out
+
+def _jsonl_replay(log_path: str, items: List[Dict[str, Any]], key: Any = None) -> int:
+    # Older rotated log first, then the live one; entries already in the base file are skipped.
+    key = key or (lambda it: it.get("id"))
+    seen = {key(it) for it in items if isinstance(it, dict)}
+    added = 0
+    for p in (log_path + ".old", log_path):
+        for entry in _jsonl_read(p):
+            k = key(entry)
+            if k in seen:
+                continue
+            seen.add(k)
+            items.append(entry)
+            added += 1
+    return added
+
+def _jsonl_reset(log_path: str) -> None:
+    # Caller holds the owning lock and rewrites the base file next: cancel a pending
+    # compaction so its (older) base payload can't land afterwards.
+    _jsonl_gen[log_path] = _jsonl_gen.get(log_path, 0) + 1
+    base_path = _jsonl_compacting.pop(log_path, None)
+    if base_path is not None:
+        with _async_write_cond:
+            queued = _ASYNC_WRITES.pop(base_path, None)
+        for cb in (queued[2] if queued else ()):
+            try:
+                cb(False)
+            except Exception:
+                pass
+    _jsonl_close(log_path)
+    for p in (log_path, log_path + ".old"):
+        try:
+            os.remove(p)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            pass
+    _jsonl_counts[log_path] = 0
+
+def _jsonl_maybe_compact(base_path: str, log_path: str, items: List[Dict[str, Any]]) -> None:
+    # Caller holds the lock owning `items`. Rotate the log aside, rewrite the base file
+    # on the background writer and drop the rotated log once that write lands.
+    if _jsonl_counts.get(log_path, 0) < max(1, JSONL_COMPACT_EVERY):
+        return
+    if log_path in _jsonl_compacting:
+        return  # previous compaction's base write still queued
+    old = log_path + ".old"
+    _jsonl_close(log_path)
+    if os.path.exists(old):
+        # A previous base write failed (or a crash left `.old`): fold the live log into
+        # it and retry, so compaction never stalls and `.old` stays the only rotated log.
+        try:
+            with open(log_path, "rb") as src, open(old, "ab") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(log_path)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            return
+    else:
+        try:
+            os.replace(log_path, old)
+        except Exception:
+            return
+    _jsonl_counts[log_path] = 0
+    gen = _jsonl_gen.get(log_path, 0)
+    _jsonl_compacting[log_path] = base_path
+
+    def _done(ok: bool) -> None:
+        if _jsonl_gen.get(log_path, 0) != gen:
+            return  # journal reset meanwhile
+        if ok:
+            try:
+                os.remove(old)
+            except Exception:
+                pass
+        # cleared last: a later compaction must not merge into `.old` before it is removed
+        _jsonl_compacting.pop(log_path, None)
+
+    # deque ring (AETHER_LOGS) is not JSON-serializable as-is
+    save_json_atomic_async(base_path, list(items) if isinstance(items, deque) else items, on_done=_done)
+
+# Journaled log/memory entries carry a "seq" unique per process run (boot token + counter).
+# Replay dedupes on it, not on content: events of one trace share a timestamp, so two
+# identical events are legitimately distinct. Entries from before seq existed fall back
+# to the content keys.
+_JOURNAL_BOOT = secrets.token_hex(4)
+_journal_seq = itertools.count(1)
+
+def _next_journal_seq() -> str:
+    return f"{_JOURNAL_BOOT}-{next(_journal_seq)}"
+
+def _memory_entry_key(entry: Dict[str, Any]) -> Any:
+    return entry.get("seq") or (entry.get("task_id"), entry.get("timestamp"))
+
+def _log_entry_key(entry: Dict[str, Any]) -> Any:
+    return entry.get("seq") or _json_dumps_line(entry)
+
+def _memory_log_append_locked() -> None:
+    # Caller holds memory_lock and just appended to AETHER_MEMORY (ring stays bounded in RAM).
+    if isinstance(AETHER_MEMORY[-1], dict):
+        AETHER_MEMORY[-1].setdefault("seq", _next_journal_seq())
+    if _jsonl_append(MEMORY_LOG_FILE, AETHER_MEMORY[-1]):
+        _jsonl_maybe_compact(MEMORY_FILE, MEMORY_LOG_FILE, AETHER_MEMORY)
+    else:
+        mark_dirty(MEMORY_FILE, AETHER_MEMORY)
+
 # -----------------------------
 # INITIAL STATE
 # -----------------------------
@@ -1181,7 +1850,8 @@ _STATE_INITIALIZED = False
 AETHER_STATE: Dict[str, Any] = dict(DEFAULT_STATE)
 AETHER_MEMORY: List[Dict[str, Any]] = []
 STRATEGIC_MEMORY: Dict[str, Any] = {"patterns": {}, "failures": {}, "history": [], "last_update": None}
-AETHER_LOGS: List[Dict[str, Any]] = []
+# Bounded: append drops the oldest entry, no truncation pass. Persist as list(AETHER_LOGS).
+AETHER_LOGS: deque = deque(maxlen=MAX_LOG_ENTRIES)
 
 # -----------------------------
 # ADAPTIVE THROTTLING (v47)
@@ -1206,6 +1876,22 @@ THROTTLE_ERROR_TYPES = {
     "TASK_TIMEOUT",
 }
 
+# Log types that change the ui_status payload (throttle windows, diagnosis scans);
+# only these invalidate the cached status.
+STATUS_EVENT_TYPES = THROTTLE_ERROR_TYPES | {
+    "TRUST_ZONE_BLOCK_ENQUEUE",
+    "TRUST_ZONE_BLOCK_EXEC",
+    "TASK_PERMISSION_DENIED",
+    "RECOVERY_EVENT",
+}
+
+# (epoch_ts, type) of throttle-relevant errors, appended by log_event so the
+# throttle reads a short window instead of re-parsing the whole log. One deque per
+# window: heads age out lazily, so each count is just len() of its deque.
+RECENT_ERROR_TS: deque = deque(maxlen=MAX_LOG_ENTRIES)
+BURST_ERROR_TS: deque = deque(maxlen=MAX_LOG_ENTRIES)
+recent_error_lock = threading.Lock()
+
 BASE_WORKER_TICK_SEC = 0.25
 BASE_SCHED_SLEEP_SEC = 2.0
 WORKER_TICK_MIN_SEC = 0.1
@@ -1230,10 +1916,32 @@ THROTTLE_STATE: Dict[str, Any] = {
     "reasons": [],
 }
 
+# Lock-free copies of the effective limits for the worker/scheduler loops; only
+# the throttle controller writes them (plain assignment, after the locked update).
+EFFECTIVE_BUDGET: int = int(THROTTLE_STATE["effective_budget"])
+EFFECTIVE_TICK: float = float(THROTTLE_STATE["effective_tick_sec"])
+EFFECTIVE_SCHED: float = float(THROTTLE_STATE["effective_sched_sleep_sec"])
+EFFECTIVE_HB: int = int(THROTTLE_STATE["effective_heartbeat_interval"])
+
+# Immutable view returned by update_throttle_state(); rebuilt only when the controller steps.
+ThrottleSnapshot = namedtuple(
+    "ThrottleSnapshot",
+    "mode score effective_budget effective_tick_sec effective_sched_sleep_sec effective_heartbeat_interval",
+)
+THROTTLE_SNAPSHOT = ThrottleSnapshot(
+    THROTTLE_STATE["mode"],
+    THROTTLE_STATE["score"],
+    EFFECTIVE_BUDGET,
+    EFFECTIVE_TICK,
+    EFFECTIVE_SCHED,
+    EFFECTIVE_HB,
+)
+
 DEFAULT_PROJECTS = [{"id": "default", "name": "Default", "created_at": safe_now()}]
 AETHER_PROJECTS: List[Dict[str, Any]] = []
 AETHER_TASKS: List[Dict[str, Any]] = []
 
+
 def enforce_core_mode(state: Dict[str, Any]) -> None:
     state["mode"] = "core"
 
@@ -1249,9 +1957,37 @@ def init_state() -> None:
         STRATEGIC_FILE,
         {"patterns": {}, "failures": {}, "history": [], "last_update": None},
     )
-    AETHER_LOGS = load_json(LOG_FILE, [])
+    loaded_logs = load_json(LOG_FILE, [])
+    if not isinstance(loaded_logs, list):
+        loaded_logs = []
+    logs_journal = os.path.exists(LOGS_LOG_FILE) or os.path.exists(LOGS_LOG_FILE + ".old")
+    if logs_journal:
+        _jsonl_replay(LOGS_LOG_FILE, loaded_logs, key=_log_entry_key)
+    AETHER_LOGS = deque(loaded_logs, maxlen=MAX_LOG_ENTRIES)
+    if logs_journal or not os.path.exists(LOG_FILE):
+        # readers (console/selftest) expect the JSON array file to exist
+        if save_json_atomic(LOG_FILE, list(AETHER_LOGS)):
+            _jsonl_reset(LOGS_LOG_FILE)
     AETHER_PROJECTS = load_json(PROJECTS_FILE, [])
     AETHER_TASKS = load_json(TASKS_FILE, [])
+    for base_path, log_path, items in (
+        (PROJECTS_FILE, PROJECTS_LOG_FILE, AETHER_PROJECTS),
+        (TASKS_FILE, TASKS_LOG_FILE, AETHER_TASKS),
+    ):
+        if not isinstance(items, list):
+            continue
+        if os.path.exists(log_path) or os.path.exists(log_path + ".old"):
+            _jsonl_replay(log_path, items)
+            if save_json_atomic(base_path, items):
+                _jsonl_reset(log_path)
+    if isinstance(AETHER_TASKS, list):
+        _rebuild_task_status_counts_locked()
+    if isinstance(AETHER_MEMORY, list) and (os.path.exists(MEMORY_LOG_FILE) or os.path.exists(MEMORY_LOG_FILE + ".old")):
+        _jsonl_replay(MEMORY_LOG_FILE, AETHER_MEMORY, key=_memory_entry_key)
+        if len(AETHER_MEMORY) > MAX_MEMORY_ENTRIES:
+            AETHER_MEMORY[:] = AETHER_MEMORY[-MAX_MEMORY_ENTRIES:]
+        if save_json_atomic(MEMORY_FILE, AETHER_MEMORY):
+            _jsonl_reset(MEMORY_LOG_FILE)
     state_touched = False
     if not PAUSED:
         for key in ("paused", "degraded", "maintenance"):
@@ -1281,9 +2017,9 @@ def export_demo1() -> str:
     try:
         ensure_demo1()
         payload = load_json(DEMO1_FILE, {"ok": False, "error": "demo1_missing"})
-        return json.dumps({"ok": True, "demo": payload}, indent=2, ensure_ascii=False)
+        return _json_dumps_pretty({"ok": True, "demo": payload})
     except Exception as e:
-        return json.dumps({"ok": False, "error": str(e)}, indent=2, ensure_ascii=False)
+        return _json_dumps_pretty({"ok": False, "error": str(e)})
 
 def export_builder_project(project_id: Optional[str] = None) -> Tuple[str, str]:
     export_id = (project_id or "").strip() or uuid.uuid4().hex[:8]
@@ -1314,23 +2050,67 @@ def export_builder_project(project_id: Optional[str] = None) -> Tuple[str, str]:
 # EVENTS LOG (JSONL)
 # -----------------------------
 
+# One O_APPEND fd for the process lifetime (events_log_lock): a single write() per
+# event. The size is tracked locally and re-synced with fstat every
+# EVENTS_LOG_STAT_EVERY writes, which also notices the file being removed/replaced.
+EVENTS_LOG_STAT_EVERY = 256
+_events_log_state: Dict[str, Any] = {"fd": None, "size": 0, "n": 0}
+
+def _events_log_close_locked() -> None:
+    fd = _events_log_state["fd"]
+    _events_log_state["fd"] = None
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+def _events_log_open_locked() -> int:
+    flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+    try:
+        fd = os.open(EVENTS_LOG_FILE, flags, 0o644)
+    except FileNotFoundError:
+        _ensure_dir(DATA_DIR, force=True)
+        fd = os.open(EVENTS_LOG_FILE, flags, 0o644)
+    _events_log_state["fd"] = fd
+    _events_log_state["size"] = os.fstat(fd).st_size
+    _events_log_state["n"] = 0
+    return fd
+
 def _rotate_events_log_if_needed() -> None:
+    # Caller holds events_log_lock.
     try:
-        if os.path.exists(EVENTS_LOG_FILE) and os.path.getsize(EVENTS_LOG_FILE) > AETHER_EVENTS_LOG_MAX_BYTES:
+        if _events_log_state["size"] > AETHER_EVENTS_LOG_MAX_BYTES:
             try:
                 os.replace(EVENTS_LOG_FILE, f"{EVENTS_LOG_FILE}.1")
             except Exception:
                 pass
+            _events_log_close_locked()
     except Exception:
         pass
 
 def _append_events_log(entry: Dict[str, Any]) -> None:
     try:
-        os.makedirs(DATA_DIR, exist_ok=True)
+        line = (_json_dumps_line(entry) + "\n").encode("utf-8")
         with events_log_lock:
-            _rotate_events_log_if_needed()
-            with open(EVENTS_LOG_FILE, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            fd = _events_log_state["fd"]
+            if fd is not None:
+                _events_log_state["n"] += 1
+                if _events_log_state["n"] >= EVENTS_LOG_STAT_EVERY:
+                    _events_log_state["n"] = 0
+                    st = os.fstat(fd)
+                    if st.st_nlink == 0:
+                        _events_log_close_locked()
+                        fd = None
+                    else:
+                        _events_log_state["size"] = st.st_size
+            if fd is not None:
+                _rotate_events_log_if_needed()
+                fd = _events_log_state["fd"]
+            if fd is None:
+                fd = _events_log_open_locked()
+            os.write(fd, line)
+            _events_log_state["size"] += len(line)
     except Exception:
         pass
 
@@ -1338,29 +2118,62 @@ def _append_events_log(entry: Dict[str, Any]) -> None:
 # LOGS + DASHBOARD
 # -----------------------------
 
+def _log_trust_block(**info: Any) -> None:
+    # kwargs dict is fresh per call, so it goes into the log as-is
+    log_event("TRUST_ZONE_BLOCK_EXEC", info)
+
 def log_event(t: str, info: Any) -> None:
-    entry = {"timestamp": safe_now(), "type": t, "info": info}
+    entry = {"timestamp": safe_now(), "type": t, "info": info, "seq": _next_journal_seq()}
+    if t in THROTTLE_ERROR_TYPES:
+        err = (time.time(), t)
+        with recent_error_lock:
+            RECENT_ERROR_TS.append(err)
+            BURST_ERROR_TS.append(err)
+    if t in STATUS_EVENT_TYPES:
+        # feeds the diagnosis/throttle views in ui_status
+        _bump_status_version()
     with log_lock:
         AETHER_LOGS.append(entry)
-        if len(AETHER_LOGS) > MAX_LOG_ENTRIES:
-            AETHER_LOGS[:] = AETHER_LOGS[-MAX_LOG_ENTRIES:]
-        save_json_atomic(LOG_FILE, AETHER_LOGS)
+        # one JSONL line per event; the JSON array base file is rewritten on compaction
+        # event log is diagnostic: no fsync per line
+        if _jsonl_append(LOGS_LOG_FILE, entry, fsync=False):
+            _jsonl_maybe_compact(LOG_FILE, LOGS_LOG_FILE, AETHER_LOGS)
+        else:
+            save_json_atomic(LOG_FILE, list(AETHER_LOGS))
     _append_events_log(entry)
 
 TASK_STATUSES = {"PENDING", "RUNNING", "DONE", "FAILED", "RECOVERED"}
 
+# Status histogram of AETHER_TASKS, kept in step with every status change (tasks_lock).
+# Rebuilt whenever the list is replaced; the generation lets a caller holding a task from
+# before a restore skip the counters (its dict is no longer in AETHER_TASKS).
+TASK_STATUS_COUNTS: Counter = Counter()
+TASK_STATUS_GEN = [0]
+
+def _rebuild_task_status_counts_locked() -> None:
+    TASK_STATUS_COUNTS.clear()
+    TASK_STATUS_COUNTS.update(
+        s for s in (t.get("status") for t in AETHER_TASKS if isinstance(t, dict)) if s in TASK_STATUSES
+    )
+    TASK_STATUS_GEN[0] += 1
+
+def _set_task_status_locked(task: Dict[str, Any], status: str, gen: Optional[int] = None) -> int:
+    if gen is None or gen == TASK_STATUS_GEN[0]:
+        old = task.get("status")
+        if old in TASK_STATUSES:
+            TASK_STATUS_COUNTS[old] -= 1
+        if status in TASK_STATUSES:
+            TASK_STATUS_COUNTS[status] += 1
+    task["status"] = status
+    return TASK_STATUS_GEN[0]
+
 def _task_status_counts() -> Dict[str, int]:
-    counts = {"PENDING": 0, "RUNNING": 0, "DONE": 0, "FAILED": 0, "RECOVERED": 0}
     with tasks_lock:
-        for t in AETHER_TASKS:
-            s = t.get("status")
-            if s in counts:
-                counts[s] += 1
-    return counts
+        return {s: TASK_STATUS_COUNTS[s] for s in ("PENDING", "RUNNING", "DONE", "FAILED", "RECOVERED")}
 
 def _orchestrator_queue_length() -> int:
     with tasks_lock:
-        return sum(1 for t in AETHER_TASKS if t.get("status") == "PENDING")
+        return TASK_STATUS_COUNTS["PENDING"]
 
 def _set_orchestrator_state(status: str, blocked_reason: Optional[str] = None, last_task: Optional[str] = None) -> None:
     with orchestrator_state_lock:
@@ -1377,9 +2190,51 @@ def _orchestrator_heartbeat() -> None:
 
 LOADED_MODULES: Dict[str, Any] = {}
 
+# Dashboard writes are coalesced: update_dashboard() only flags the file dirty and a
+# single flusher thread writes at most once per DASH_MIN_INTERVAL_SEC.
+DASH_MIN_INTERVAL_SEC = float(os.environ.get("AETHER_DASH_MIN_INTERVAL_SEC", "0.1"))
+DASH_DIRTY = threading.Event()
+_dash_flusher_state: Dict[str, Any] = {"thread": None}
+dash_flusher_lock = threading.Lock()
+
+def _dashboard_flusher_loop() -> None:
+    # Runs for the process lifetime (daemon), like the dirty-file flusher: stopping the
+    # loops with STOP_EVENT must not leave update_dashboard() spawning threads that exit
+    # without writing.
+    while True:
+        DASH_DIRTY.wait()
+        DASH_DIRTY.clear()
+        try:
+            _write_dashboard()
+        except Exception as e:
+            log_event("DASHBOARD_WRITE_FAIL", {"file": DASHBOARD_FILE, "error": str(e)})
+        time.sleep(max(0.0, DASH_MIN_INTERVAL_SEC))
+
 def update_dashboard() -> None:
+    DASH_DIRTY.set()
+    with dash_flusher_lock:
+        th = _dash_flusher_state.get("thread")
+        if th is None or not th.is_alive():
+            th = threading.Thread(target=_dashboard_flusher_loop, daemon=True)
+            _dash_flusher_state["thread"] = th
+            th.start()
+
+def flush_dashboard() -> None:
+    # Pending coalesced update -> write now (boot, shutdown).
+    if DASH_DIRTY.is_set():
+        DASH_DIRTY.clear()
+        _write_dashboard()
+
+atexit.register(flush_dashboard)
+
+def _write_dashboard() -> None:
+    # only the four fields the dashboard shows, not a copy of the whole state dict
     with state_lock:
-        snap = dict(AETHER_STATE)
+        g = AETHER_STATE.get
+        energy = g("energy", 0)
+        focus = g("focus", "STANDBY")
+        status = g("status", "IDLE")
+        last_cycle = g("last_cycle")
     with modules_lock:
         modules_loaded = len(LOADED_MODULES)
     with projects_lock:
@@ -1390,11 +2245,11 @@ def update_dashboard() -> None:
         orchestrator_snapshot = dict(ORCHESTRATOR_STATE)
 
     dash = {
-        "energy": snap.get("energy", 0),
-        "focus": snap.get("focus", "STANDBY"),
-        "status": snap.get("status", "IDLE"),
-        "queue_size": TASK_QUEUE.qsize(),
-        "last_cycle": snap.get("last_cycle"),
+        "energy": energy,
+        "focus": focus,
+        "status": status,
+        "queue_size": task_queue_size(),
+        "last_cycle": last_cycle,
         "version": AETHER_VERSION,
         "data_dir": DATA_DIR,
         "modules_loaded": modules_loaded,
@@ -1432,6 +2287,7 @@ def enable_safe_mode(reason: str) -> None:
         SAFE_MODE["enabled"] = True
         SAFE_MODE["since"] = safe_now()
         SAFE_MODE["reason"] = reason
+        _bump_diagnosis_version()
     elif not SAFE_MODE.get("since"):
         SAFE_MODE["since"] = safe_now()
         SAFE_MODE["reason"] = reason
@@ -1440,49 +2296,74 @@ def enable_safe_mode(reason: str) -> None:
         log_event("SAFE_MODE_ON", {"reason": SAFE_MODE.get("reason"), "since": SAFE_MODE.get("since")})
     with state_lock:
         AETHER_STATE["status"] = "SAFE_MODE"
-        save_json_atomic(STATE_FILE, AETHER_STATE)
+        mark_dirty(STATE_FILE, AETHER_STATE)
 
 # -----------------------------
 # QUEUE + DEDUP
 # -----------------------------
-TASK_QUEUE: PriorityQueue = PriorityQueue()
-QUEUE_SET = set()
-
-TASK_DEDUP: List[str] = []
+# Priority heap of (priority, seq, task) guarded by queue_lock, the same lock as the
+# dedup sets, so an enqueue takes one lock. seq keeps FIFO order among equal
+# priorities (and tasks dicts are never compared).
+TASK_HEAP: List[Tuple[int, int, Dict[str, Any]]] = []
+_task_heap_seq = itertools.count()
+TASK_HEAP_READY = threading.Condition(queue_lock)
+QUEUE_SET = set()  # 16-byte digests of queued commands (see _cmd_key)
+
+def task_queue_size() -> int:
+    return len(TASK_HEAP)
+
+def _task_heap_pop(timeout: float = 0.0) -> Optional[Dict[str, Any]]:
+    with queue_lock:
+        if not TASK_HEAP and timeout > 0:
+            TASK_HEAP_READY.wait_for(lambda: TASK_HEAP, timeout)
+        if not TASK_HEAP:
+            return None
+        return heapq.heappop(TASK_HEAP)[2]
+
+# Bounded FIFO of dedup keys; the set mirrors it (evicted keys leave the set too).
+# Guarded by queue_lock together with QUEUE_SET: one check, one critical section.
+TASK_DEDUP: deque = deque(maxlen=MAX_DEDUP_KEYS)
 TASK_DEDUP_SET = set()
 
+def _cmd_key(command: str) -> bytes:
+    return hashlib.blake2b(command.encode("utf-8"), digest_size=16).digest()
+
 def tasks_queue_contains(command: str) -> bool:
     c = (command or "").strip()
     if not c:
         return False
+    key = _cmd_key(c)
     with queue_lock:
-        return c in QUEUE_SET
+        return key in QUEUE_SET
 
-def _dedup_prune_if_needed() -> None:
-    with dedup_lock:
-        if len(TASK_DEDUP) <= MAX_DEDUP_KEYS:
-            return
-        keep = int(MAX_DEDUP_KEYS * 0.7)
-        old = TASK_DEDUP[:-keep]
-        TASK_DEDUP[:] = TASK_DEDUP[-keep:]
-        for k in old:
-            TASK_DEDUP_SET.discard(k)
+def _dedup_push_locked(key: str) -> None:
+    # Caller holds queue_lock. O(1): the deque drops its oldest key when full.
+    if len(TASK_DEDUP) == TASK_DEDUP.maxlen:
+        TASK_DEDUP_SET.discard(TASK_DEDUP[0])
+    TASK_DEDUP.append(key)
+    TASK_DEDUP_SET.add(key)
 
 def compute_priority(base: int) -> int:
-    with state_lock:
-        e = int(AETHER_STATE.get("energy", 0))
+    # Lock-free: a single dict.get of a scalar is atomic under the GIL and energy is
+    # only ever replaced whole, so the hot enqueue path never waits on state_lock.
+    e = int(AETHER_STATE.get("energy", 0))
     return int(base) + (3 if e < 20 else 0)
 
+TASK_TYPE_KEYWORDS: Dict[str, str] = {
+    "export": "io_export",
+    "restore": "write_state", "import": "write_state",
+    "reload": "system", "plugin": "system",
+}
+TASK_TYPE_PRIORITY = ("io_export", "write_state", "system")
+_TASK_TYPE_RE = re.compile("(?=(" + "|".join(re.escape(k) for k in TASK_TYPE_KEYWORDS) + "))")
+
 def _infer_task_type(command: str, source: str) -> str:
-    cmd = (command or "").lower()
     if source == "internal":
         return "read_only"
-    if any(k in cmd for k in ["export", "snapshot export", "replica export"]):
-        return "io_export"
-    if any(k in cmd for k in ["restore", "import", "snapshot restore", "replica import"]):
-        return "write_state"
-    if any(k in cmd for k in ["reload", "plugin", "plugins"]):
-        return "system"
+    found = {TASK_TYPE_KEYWORDS[m] for m in _TASK_TYPE_RE.findall((command or "").lower())}
+    for task_type in TASK_TYPE_PRIORITY:
+        if task_type in found:
+            return task_type
     return "analysis"
 
 def _task_mode(task: Dict[str, Any]) -> str:
@@ -1498,13 +2379,13 @@ def can_execute(task_type: str, mode: str) -> bool:
 def _canonical_task_payload(task: Dict[str, Any]) -> str:
     payload = dict(task or {})
     payload.pop("signature", None)
-    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return _CANON_ENCODE(payload)
 
 def sign_task(task: Dict[str, Any]) -> Optional[str]:
     if not AETHER_TASK_SECRET:
         return None
     msg = _canonical_task_payload(task)
-    return hmac.new(AETHER_TASK_SECRET.encode("utf-8"), msg.encode("utf-8"), hashlib.sha256).hexdigest()
+    return hmac.new(AETHER_TASK_SECRET_BYTES, msg.encode("utf-8"), hashlib.sha256).hexdigest()
 
 def verify_task(task: Dict[str, Any]) -> bool:
     global _SIGNATURE_WARNED
@@ -1513,9 +2394,12 @@ def verify_task(task: Dict[str, Any]) -> bool:
             _SIGNATURE_WARNED = True
             log_event("TASK_SIGNATURE_SKIPPED", {"reason": "AETHER_TASK_SECRET_EMPTY"})
         return True
-    expected = sign_task(task)
     provided = task.get("signature")
-    if not expected or not isinstance(provided, str):
+    if not isinstance(provided, str) or not provided:
+        # nothing to compare: skip the canonical dump + HMAC
+        return False
+    expected = sign_task(task)
+    if not expected:
         return False
     return hmac.compare_digest(expected, provided)
 
@@ -1549,15 +2433,10 @@ def enqueue_task(
         log_event("HEARTBEAT_DISABLED", {"message": "Heartbeat disabled: blocked enqueue"})
         return {"ok": False, "blocked": True, "reason": "heartbeat_disabled"}
 
-    # dedup only external
-    if source != "internal":
-        key = f"{command}:{source}"
-        with dedup_lock:
-            if key in TASK_DEDUP_SET:
-                return {"ok": False, "dedup": True}
-            TASK_DEDUP_SET.add(key)
-            TASK_DEDUP.append(key)
-        _dedup_prune_if_needed()
+    # dedup only external; lock-free early reject here, authoritative check below
+    dkey = f"{command}:{source}" if source != "internal" else None
+    if dkey is not None and dkey in TASK_DEDUP_SET:
+        return {"ok": False, "dedup": True}
 
     dyn = compute_priority(int(priority))
     resolved_type = (task_type or "").strip() or _infer_task_type(command, source)
@@ -1577,7 +2456,7 @@ def enqueue_task(
         )
         return {"ok": False, "blocked": True, "reason": reason}
     task = {
-        "id": str(uuid.uuid4()),
+        "id": secrets.token_hex(16),
         "command": command,
         "source": source,
         "created_at": safe_now(),
@@ -1591,11 +2470,16 @@ def enqueue_task(
     if signature:
         task["signature"] = signature
 
+    qkey = _cmd_key(command)
     with queue_lock:
-        if command in QUEUE_SET:
+        # the dedup key is recorded only when the task actually reaches the queue
+        if qkey in QUEUE_SET or (dkey is not None and dkey in TASK_DEDUP_SET):
             return {"ok": False, "dedup": True}
-        TASK_QUEUE.put((dyn, task))
-        QUEUE_SET.add(command)
+        heapq.heappush(TASK_HEAP, (dyn, next(_task_heap_seq), task))
+        QUEUE_SET.add(qkey)
+        TASK_HEAP_READY.notify()
+        if dkey is not None:
+            _dedup_push_locked(dkey)
 
     log_event(
         "ENQUEUE",
@@ -1623,28 +2507,59 @@ def record_strategy(command: str, mode: str, success: bool) -> None:
         STRATEGIC_MEMORY["history"].append(
             {"timestamp": safe_now(), "command": command, "mode": mode, "success": bool(success)}
         )
-        if len(STRATEGIC_MEMORY["history"]) > MAX_STRATEGY_HISTORY:
-            STRATEGIC_MEMORY["history"] = STRATEGIC_MEMORY["history"][-MAX_STRATEGY_HISTORY:]
+        history = STRATEGIC_MEMORY["history"]
+        if len(history) > MAX_STRATEGY_HISTORY:
+            # trim in place (no new list per append once full)
+            del history[: len(history) - MAX_STRATEGY_HISTORY]
         STRATEGIC_MEMORY["last_update"] = safe_now()
-        save_json_atomic(STRATEGIC_FILE, STRATEGIC_MEMORY)
+        mark_dirty(STRATEGIC_FILE, STRATEGIC_MEMORY)
 
 # -----------------------------
 # PLUGINS HOT-RELOAD (*_ai.py)
 # -----------------------------
 
+def _stat_key(path: str) -> Optional[Tuple[int, int]]:
+    # (mtime_ns, size): cheap change detector for the listing / pack caches
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+_PLUGIN_FILES_CACHE: Dict[str, Any] = {"key": None, "files": []}
+
 def _list_plugin_files() -> List[str]:
+    # a file added/removed/renamed bumps the directory mtime
+    key = _stat_key(MODULES_DIR)
+    if key is not None and _PLUGIN_FILES_CACHE["key"] == key:
+        return list(_PLUGIN_FILES_CACHE["files"])
     try:
         files = [f for f in os.listdir(MODULES_DIR) if f.endswith("_ai.py") and not f.startswith("_")]
         files.sort()
-        return files
     except Exception:
         return []
+    _PLUGIN_FILES_CACHE.update({"key": key, "files": files})
+    return list(files)
+
+# name -> _stat_key of the file the loaded module came from
+_PLUGIN_SIG: Dict[str, Tuple[int, int]] = {}
 
 def reload_ai_modules() -> List[str]:
     loaded: Dict[str, Any] = {}
+    with modules_lock:
+        current = dict(LOADED_MODULES)
+    sigs: Dict[str, Tuple[int, int]] = {}
+    reused = 0
     for fn in _list_plugin_files():
         name = fn[:-3]
         path = os.path.join(MODULES_DIR, fn)
+        sig = _stat_key(path)
+        # unchanged file (mtime_ns, size) -> keep the module object, no re-exec
+        if sig is not None and name in current and _PLUGIN_SIG.get(name) == sig:
+            loaded[name] = current[name]
+            sigs[name] = sig
+            reused += 1
+            continue
         try:
             mod_name = f"plugins.{name}"
             spec = importlib.util.spec_from_file_location(mod_name, path)
@@ -1656,6 +2571,8 @@ def reload_ai_modules() -> List[str]:
 
             if callable(getattr(mod, "can_handle", None)) and callable(getattr(mod, "run", None)):
                 loaded[name] = mod
+                if sig is not None:
+                    sigs[name] = sig
             else:
                 log_event("MODULE_SKIPPED", {"module": name, "reason": "missing can_handle/run"})
         except Exception as e:
@@ -1664,8 +2581,10 @@ def reload_ai_modules() -> List[str]:
     with modules_lock:
         LOADED_MODULES.clear()
         LOADED_MODULES.update(loaded)
+    _PLUGIN_SIG.clear()
+    _PLUGIN_SIG.update(sigs)
 
-    log_event("MODULES_RELOADED", {"modules": list(LOADED_MODULES.keys())})
+    log_event("MODULES_RELOADED", {"modules": list(LOADED_MODULES.keys()), "reused": reused})
     update_dashboard()
     return list(LOADED_MODULES.keys())
 
@@ -1753,7 +2672,7 @@ def _read_plugin_state() -> Dict[str, Any]:
             }
         return {
             "state": state_snapshot,
-            "queue_size": TASK_QUEUE.qsize(),
+            "queue_size": task_queue_size(),
             "memory_len": len(AETHER_MEMORY),
             "strategic": strategic,
             "kill_switch": KILL_SWITCH,
@@ -1900,10 +2819,28 @@ def _rebuild_snapshot_index() -> List[Dict[str, Any]]:
     save_json_atomic(SNAPSHOT_INDEX_FILE, _snapshot_index_payload(entries))
     return entries
 
+def _snapshot_dir_has_snapshots() -> bool:
+    # mtimes can't prove an empty index current (a snapshot written in the same tick
+    # as the index looks "older"); stop at the first snapshot file instead.
+    index_name = os.path.basename(SNAPSHOT_INDEX_FILE)
+    try:
+        with os.scandir(SNAPSHOT_DIR) as it:
+            for de in it:
+                if de.name.endswith(".json") and de.name != index_name:
+                    return True
+    except FileNotFoundError:
+        return False
+    except Exception:
+        return True
+    return False
+
 def _load_snapshot_index() -> List[Dict[str, Any]]:
     payload = load_json(SNAPSHOT_INDEX_FILE, None)
     entries = _snapshot_index_entries(payload)
     if not entries:
+        # Empty but well-formed index and no snapshot files: nothing to rebuild.
+        if isinstance(payload, dict) and isinstance(payload.get("snapshots"), list) and not _snapshot_dir_has_snapshots():
+            return []
         return _rebuild_snapshot_index()
     valid = []
     for entry in entries:
@@ -1921,23 +2858,32 @@ def _update_snapshot_index(name: str, payload: Dict[str, Any]) -> None:
     entry = _snapshot_entry_from_payload(payload, name)
     if entry is None:
         return
-    updated = False
-    for idx, existing in enumerate(entries):
-        if existing.get("name") == entry.get("name"):
-            entries[idx] = entry
-            updated = True
-            break
-    if not updated:
-        entries.append(entry)
-    entries.sort(key=lambda item: item.get("name") or "")
+    # el indice se guarda ordenado por nombre: localizar con bisect en vez de re-ordenar
+    key = entry.get("name") or ""
+    pos = bisect.bisect_left(entries, key, key=lambda item: item.get("name") or "")
+    if pos < len(entries) and (entries[pos].get("name") or "") == key:
+        entries[pos] = entry
+    else:
+        entries.insert(pos, entry)
     save_json_atomic(SNAPSHOT_INDEX_FILE, _snapshot_index_payload(entries))
 
+_SNAPSHOT_LIST_CACHE: Dict[str, Any] = {"key": None, "names": []}
+
 def snapshot_list() -> List[str]:
+    # Reuse the names while neither the snapshot dir nor the index file changed.
+    key = (_stat_key(SNAPSHOT_DIR), _stat_key(SNAPSHOT_INDEX_FILE))
+    if key[0] is not None and _SNAPSHOT_LIST_CACHE["key"] == key:
+        return list(_SNAPSHOT_LIST_CACHE["names"])
     try:
         entries = _load_snapshot_index()
-        return [item.get("name") for item in entries if item.get("name")]
+        names = [item.get("name") for item in entries if item.get("name")]
     except Exception:
         return []
+    # the index may have been rewritten while loading: key on the state after it
+    _SNAPSHOT_LIST_CACHE.update(
+        {"key": (_stat_key(SNAPSHOT_DIR), _stat_key(SNAPSHOT_INDEX_FILE)), "names": names}
+    )
+    return list(names)
 
 def _read_text_file(path: str, limit_bytes: int = 250_000) -> str:
     try:
@@ -1950,11 +2896,27 @@ def _read_text_file(path: str, limit_bytes: int = 250_000) -> str:
     except Exception:
         return ""
 
+# path -> ((mtime_ns, size), text): unchanged plugin files are not re-read per pack
+_PLUGIN_TEXT_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
 def snapshot_pack_plugins() -> Dict[str, str]:
     packed: Dict[str, str] = {}
     for fn in _list_plugin_files():
         p = os.path.join(MODULES_DIR, fn)
-        packed[f"{MODULES_DIR}/{fn}"] = _read_text_file(p)
+        key = _stat_key(p)
+        hit = _PLUGIN_TEXT_CACHE.get(p)
+        if key is not None and hit is not None and hit[0] == key:
+            txt = hit[1]
+        else:
+            txt = _read_text_file(p)
+            if key is not None:
+                _PLUGIN_TEXT_CACHE[p] = (key, txt)
+        packed[f"{MODULES_DIR}/{fn}"] = txt
+    if len(_PLUGIN_TEXT_CACHE) > len(packed):
+        # drop texts of plugins that no longer exist
+        live = {os.path.join(MODULES_DIR, fn) for fn in _list_plugin_files()}
+        for p in [p for p in _PLUGIN_TEXT_CACHE if p not in live]:
+            _PLUGIN_TEXT_CACHE.pop(p, None)
     return packed
 
 def snapshot_apply_plugins(packed: Dict[str, str]) -> Dict[str, Any]:
@@ -1963,54 +2925,109 @@ def snapshot_apply_plugins(packed: Dict[str, str]) -> Dict[str, Any]:
     try:
         os.makedirs(MODULES_DIR, exist_ok=True)
         wrote = 0
+        prefix = f"{MODULES_DIR}/"
+        plen = len(prefix)
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
         for rel, txt in packed.items():
-            if not isinstance(rel, str) or not rel.startswith(f"{MODULES_DIR}/") or not rel.endswith(".py"):
+            if not isinstance(rel, str) or rel[:plen] != prefix or not rel.endswith("_ai.py"):
                 continue
-            base = os.path.basename(rel)
-            if not base.endswith("_ai.py"):
-                continue
-            out_path = os.path.join(MODULES_DIR, base)
-            with open(out_path, "w", encoding="utf-8") as f:
-                f.write(txt if isinstance(txt, str) else "")
+            out_path = os.path.join(MODULES_DIR, os.path.basename(rel))
+            data = memoryview((txt if isinstance(txt, str) else "").encode("utf-8"))
+            fd = os.open(out_path, flags, 0o644)
+            try:
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
             wrote += 1
         return {"ok": True, "wrote": wrote}
     except Exception as e:
         return {"ok": False, "error": str(e)}
 
-def snapshot_create(name: str = "demo1") -> Dict[str, Any]:
-    name = (name or "demo1").strip()
-    path = _snapshot_path(name)
+# Snapshot persistence worker: one thread, so snapshots land in submission order.
+_SNAP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aether-snapshot")
+_SNAP_PENDING: List[Any] = []  # futures not yet known to be done (_snap_pending_lock)
+_snap_pending_lock = threading.Lock()
+# name -> {"error", "file", "ts"} of background snapshots that did not land (cleared
+# when the same name is later written); shown by ui_snapshot_list.
+SNAPSHOT_FAILURES: Dict[str, Dict[str, Any]] = {}
+
+def snapshot_flush(timeout: Optional[float] = None) -> bool:
+    # Wait for background snapshot writes (snapshot_create(wait=False)); True if none left.
+    # Never call from the snapshot worker itself.
+    with _snap_pending_lock:
+        pending = list(_SNAP_PENDING)
+    deadline = None if timeout is None else time.time() + max(0.0, timeout)
+    for fut in pending:
+        try:
+            fut.result(timeout=None if deadline is None else max(0.0, deadline - time.time()))
+        except FuturesTimeoutError:
+            return False
+        except Exception:
+            pass
+    with _snap_pending_lock:
+        _SNAP_PENDING[:] = [f for f in _SNAP_PENDING if not f.done()]
+        return not _SNAP_PENDING
+
+# registered after flush_pending_writes, so it runs first at exit (atexit is LIFO)
+atexit.register(snapshot_flush)
+
+def _snapshot_capture(name: str) -> Dict[str, Any]:
+    # Each structure is copied under its own lock only (shallow copies, same as
+    # replica_export): the snapshot is point-in-time per structure, not globally
+    # atomic, and log_event/enqueue_task/record_strategy never wait on the whole
+    # capture. Plugin packing and serialization run with no lock held.
+    with snap_lock:
+        with state_lock:
+            st = dict(AETHER_STATE)
+        with memory_lock:
+            mem = list(AETHER_MEMORY)
+        with strategic_lock:
+            strat = dict(STRATEGIC_MEMORY)
+        with log_lock:
+            logs = list(AETHER_LOGS)
+        with projects_lock:
+            projects = list(AETHER_PROJECTS)
+        with tasks_lock:
+            tasks = list(AETHER_TASKS)
+        with modules_lock:
+            modules = list(LOADED_MODULES.keys())
 
-    with snap_lock, state_lock, memory_lock, strategic_lock, log_lock, projects_lock, tasks_lock, modules_lock:
-        payload = {
-            "ok": True,
-            "name": name,
-            "created_at": safe_now(),
-            "version": AETHER_VERSION,
-            "env": {
-                "heartbeat_enabled": bool(AETHER_HEARTBEAT_ENABLED),
-                "task_runner_enabled": bool(AETHER_TASK_RUNNER_ENABLED),
-                "freeze_mode": bool(is_frozen()),
-                "safe_mode": dict(SAFE_MODE),
-                "data_dir": DATA_DIR,
-                "task_budget": max(1, int(AETHER_TASK_BUDGET)),
-                "task_max_retries": max(0, int(AETHER_TASK_MAX_RETRIES)),
-            },
-            "files": {
-                "state": dict(AETHER_STATE),
-                "memory": list(AETHER_MEMORY),
-                "strategic": dict(STRATEGIC_MEMORY),
-                "logs": list(AETHER_LOGS),
-                "modules": list(LOADED_MODULES.keys()),
-                "projects": list(AETHER_PROJECTS),
-                "tasks": list(AETHER_TASKS),
-            },
-            "plugins": {"format": "plugins-text-v1", "files": snapshot_pack_plugins()},
-            "notes": "snapshot includes plugins + projects/tasks + lifecycle/retry/budget/planning",
-        }
+    payload = {
+        "ok": True,
+        "name": name,
+        "created_at": safe_now(),
+        "version": AETHER_VERSION,
+        "env": {
+            "heartbeat_enabled": bool(AETHER_HEARTBEAT_ENABLED),
+            "task_runner_enabled": bool(AETHER_TASK_RUNNER_ENABLED),
+            "freeze_mode": bool(is_frozen()),
+            "safe_mode": dict(SAFE_MODE),
+            "data_dir": DATA_DIR,
+            "task_budget": max(1, int(AETHER_TASK_BUDGET)),
+            "task_max_retries": max(0, int(AETHER_TASK_MAX_RETRIES)),
+        },
+        "files": {
+            "state": st,
+            "memory": mem,
+            "strategic": strat,
+            "logs": logs,
+            "modules": modules,
+            "projects": projects,
+            "tasks": tasks,
+        },
+        "plugins": {"format": "plugins-text-v1", "files": snapshot_pack_plugins()},
+        "notes": "snapshot includes plugins + projects/tasks + lifecycle/retry/budget/planning",
+    }
+    return payload
 
-    ok = save_json_atomic(path, payload)
+def _snapshot_persist(name: str, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    # base files on disk catch up with the state this snapshot captured
+    flush_dirty()
+    ok = save_json_atomic(path, payload, fsync=True)
     if ok:
+        with _snap_pending_lock:
+            SNAPSHOT_FAILURES.pop(name, None)
         _update_snapshot_index(name, payload)
         log_event("SNAPSHOT_CREATED", {"name": name, "file": path, "plugins": len(payload["plugins"]["files"])})
         update_dashboard()
@@ -2018,8 +3035,39 @@ def snapshot_create(name: str = "demo1") -> Dict[str, Any]:
     log_event("SNAPSHOT_CREATE_FAIL", {"name": name, "file": path})
     return {"ok": False, "error": "snapshot_write_failed", "file": path}
 
+def _snapshot_persist_bg(name: str, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    # The caller was already told {ok, pending}: keep the outcome where the UI can see it.
+    try:
+        res = _snapshot_persist(name, path, payload)
+    except Exception as e:
+        res = {"ok": False, "error": str(e), "file": path}
+        log_event("SNAPSHOT_CREATE_FAIL", {"name": name, "file": path, "error": str(e)})
+    if not res.get("ok"):
+        with _snap_pending_lock:
+            SNAPSHOT_FAILURES[name] = {"error": res.get("error"), "file": path, "ts": safe_now()}
+    return res
+
+def snapshot_create(name: str = "demo1", wait: bool = True) -> Dict[str, Any]:
+    # wait=False: only the capture runs on the caller's thread; serialize + write +
+    # fsync happen on the snapshot worker (snapshot_flush() waits for them).
+    name = (name or "demo1").strip()
+    path = _snapshot_path(name)
+    payload = _snapshot_capture(name)
+    if wait:
+        return _snapshot_persist(name, path, payload)
+    try:
+        fut = _SNAP_EXECUTOR.submit(_snapshot_persist_bg, name, path, payload)
+    except RuntimeError:
+        # executor already shut down (interpreter exit): write on this thread
+        return _snapshot_persist(name, path, payload)
+    with _snap_pending_lock:
+        _SNAP_PENDING[:] = [f for f in _SNAP_PENDING if not f.done()]
+        _SNAP_PENDING.append(fut)
+    return {"ok": True, "pending": True, "name": name, "file": path}
+
 def snapshot_restore(name: str = "demo1") -> Dict[str, Any]:
     name = (name or "demo1").strip()
+    snapshot_flush()
     entries = _load_snapshot_index()
     entry = next((item for item in entries if item.get("name") == name), None)
     path = _snapshot_path(entry.get("name") if entry else name)
@@ -2055,21 +3103,23 @@ def snapshot_restore(name: str = "demo1") -> Dict[str, Any]:
     projects = files.get("projects", [])
     tasks = files.get("tasks", [])
 
-    with state_lock:
+    writes: List[Tuple[str, Any, int]] = []
+    # Mutate everything under one critical section (same lock order as snapshot_create) so
+    # readers never observe a half-restored system; persistence happens after, in one batch.
+    with state_lock, memory_lock, strategic_lock, log_lock, projects_lock, tasks_lock:
         AETHER_STATE.clear()
         AETHER_STATE.update(st if isinstance(st, dict) else dict(DEFAULT_STATE))
         enforce_core_mode(AETHER_STATE)
         AETHER_STATE["version"] = AETHER_VERSION
         AETHER_STATE["status"] = "FROZEN" if is_frozen() else AETHER_STATE.get("status", "IDLE")
-        save_json_atomic(STATE_FILE, AETHER_STATE)
+        writes.append((STATE_FILE, dict(AETHER_STATE), next(_write_seq)))
 
-    with memory_lock:
         AETHER_MEMORY.clear()
         if isinstance(mem, list):
             AETHER_MEMORY.extend(mem)
-        save_json_atomic(MEMORY_FILE, AETHER_MEMORY)
+        _jsonl_reset(MEMORY_LOG_FILE)
+        writes.append((MEMORY_FILE, list(AETHER_MEMORY), next(_write_seq)))
 
-    with strategic_lock:
         STRATEGIC_MEMORY.clear()
         STRATEGIC_MEMORY.update(strat if isinstance(strat, dict) else {"patterns": {}, "failures": {}, "history": [], "last_update": None})
         if not isinstance(STRATEGIC_MEMORY.get("history"), list):
@@ -2077,28 +3127,30 @@ def snapshot_restore(name: str = "demo1") -> Dict[str, Any]:
         if len(STRATEGIC_MEMORY["history"]) > MAX_STRATEGY_HISTORY:
             STRATEGIC_MEMORY["history"] = STRATEGIC_MEMORY["history"][-MAX_STRATEGY_HISTORY:]
         STRATEGIC_MEMORY["last_update"] = safe_now()
-        save_json_atomic(STRATEGIC_FILE, STRATEGIC_MEMORY)
+        writes.append((STRATEGIC_FILE, dict(STRATEGIC_MEMORY), next(_write_seq)))
 
-    with log_lock:
         AETHER_LOGS.clear()
         if isinstance(logs, list):
             AETHER_LOGS.extend(logs)
-        save_json_atomic(LOG_FILE, AETHER_LOGS)
+        _jsonl_reset(LOGS_LOG_FILE)
+        writes.append((LOG_FILE, list(AETHER_LOGS), next(_write_seq)))
 
-    with projects_lock:
         AETHER_PROJECTS.clear()
         if isinstance(projects, list) and projects:
             AETHER_PROJECTS.extend(projects)
         else:
             AETHER_PROJECTS.extend(list(DEFAULT_PROJECTS))
-        save_json_atomic(PROJECTS_FILE, AETHER_PROJECTS)
+        _jsonl_reset(PROJECTS_LOG_FILE)
+        writes.append((PROJECTS_FILE, list(AETHER_PROJECTS), next(_write_seq)))
 
-    with tasks_lock:
         AETHER_TASKS.clear()
         if isinstance(tasks, list):
             AETHER_TASKS.extend(tasks)
         _normalize_tasks_locked()
-        save_json_atomic(TASKS_FILE, AETHER_TASKS)
+        _jsonl_reset(TASKS_LOG_FILE)
+        writes.append((TASKS_FILE, list(AETHER_TASKS), next(_write_seq)))
+
+    save_json_atomic_batch(writes)
 
     plug = payload.get("plugins", {}) if isinstance(payload, dict) else {}
     if isinstance(plug, dict) and isinstance(plug.get("files"), dict):
@@ -2112,6 +3164,7 @@ def snapshot_restore(name: str = "demo1") -> Dict[str, Any]:
 
 def snapshot_export(name: str = "demo1") -> str:
     name = (name or "demo1").strip()
+    snapshot_flush()
     entries = _load_snapshot_index()
     entry = next((item for item in entries if item.get("name") == name), None)
     path = _snapshot_path(entry.get("name") if entry else name)
@@ -2122,23 +3175,19 @@ def snapshot_export(name: str = "demo1") -> str:
             payload = load_json(fallback_path, None)
         if not payload:
             available = [item.get("name") for item in entries if item.get("name")]
-            return json.dumps(
-                {"ok": False, "error": "snapshot_not_found", "name": name, "available": available},
-                indent=2,
-                ensure_ascii=False,
-            )
-    return json.dumps(payload, indent=2, ensure_ascii=False)
+            return _json_dumps_pretty({"ok": False, "error": "snapshot_not_found", "name": name, "available": available})
+    return _json_dumps_pretty(payload)
 
 def snapshot_import(json_text: str) -> Dict[str, Any]:
     try:
-        payload = json.loads(json_text or "")
+        payload = _json_loads(json_text or "")
         if not isinstance(payload, dict) or not payload.get("ok"):
             return {"ok": False, "error": "invalid_payload"}
         name = (payload.get("name") or "imported").strip()
         if not payload.get("created_at"):
             return {"ok": False, "error": "invalid_payload_missing_created_at"}
         path = _snapshot_path(name)
-        ok = save_json_atomic(path, payload)
+        ok = save_json_atomic(path, payload, fsync=True)
         if ok:
             _update_snapshot_index(name, payload)
             log_event("SNAPSHOT_IMPORTED", {"name": name, "file": path})
@@ -2152,9 +3201,26 @@ def snapshot_import(json_text: str) -> Dict[str, Any]:
 # REPLICA (v28.2)
 # -----------------------------
 REPLICA_FORMAT = "aether-replica-v28.2"
+# sha256 (default, portable) | blake3 (if importable); the field name carries the algorithm
+REPLICA_CHECKSUM_ALGO = os.environ.get("AETHER_REPLICA_CHECKSUM", "sha256").strip().lower()
+if REPLICA_CHECKSUM_ALGO != "blake3" or blake3 is None:
+    REPLICA_CHECKSUM_ALGO = "sha256"
+REPLICA_BLAKE3_MT_BYTES = 1 << 20
+
+def blake3_bytes(b: bytes) -> str:
+    if len(b) > REPLICA_BLAKE3_MT_BYTES:
+        return blake3.blake3(b, max_threads=blake3.blake3.AUTO).hexdigest()
+    return blake3.blake3(b).hexdigest()
+
+def _replica_digest(raw: bytes, algo: str) -> str:
+    if algo == "blake3":
+        return blake3_bytes(raw)
+    return hashlib.sha256(raw).hexdigest()
 
 def replica_export(name: str = "replica") -> str:
     name = (name or "replica").strip()
+    snapshot_flush()
+    flush_dirty()
 
     with state_lock:
         st = dict(AETHER_STATE)
@@ -2203,10 +3269,12 @@ def replica_export(name: str = "replica") -> str:
         },
     }
 
-    copy = dict(payload)
-    txt = json.dumps(copy, indent=2, ensure_ascii=False, sort_keys=True)
-    payload["checksum_sha256"] = sha256_text(txt)
-    return json.dumps(payload, indent=2, ensure_ascii=False)
+    # Serialize once: the canonical (sorted) text is both the checksum input and the
+    # export body, with the checksum key spliced in first (importers re-canonicalize).
+    raw = _json_dumps_pretty_bytes(payload, sort_keys=True)
+    algo = REPLICA_CHECKSUM_ALGO
+    checksum = _replica_digest(raw, algo)
+    return '{\n  "checksum_%s": "%s",\n%s' % (algo, checksum, raw[2:].decode("utf-8"))
 
 def replica_apply(payload: Dict[str, Any]) -> Dict[str, Any]:
     bundle = (payload or {}).get("bundle", {}) or {}
@@ -2219,39 +3287,43 @@ def replica_apply(payload: Dict[str, Any]) -> Dict[str, Any]:
     tasks = bundle.get("tasks", [])
     plugins = bundle.get("plugins", {})
 
+    writes: List[Tuple[str, Any, int]] = []
     with state_lock:
         AETHER_STATE.clear()
         AETHER_STATE.update(st if isinstance(st, dict) else dict(DEFAULT_STATE))
         enforce_core_mode(AETHER_STATE)
         AETHER_STATE["version"] = AETHER_VERSION
         AETHER_STATE["status"] = "FROZEN" if is_frozen() else AETHER_STATE.get("status", "IDLE")
-        save_json_atomic(STATE_FILE, AETHER_STATE)
+        writes.append((STATE_FILE, dict(AETHER_STATE), next(_write_seq)))
 
     with memory_lock:
         AETHER_MEMORY.clear()
         if isinstance(mem, list):
             AETHER_MEMORY.extend(mem)
-        save_json_atomic(MEMORY_FILE, AETHER_MEMORY)
+        _jsonl_reset(MEMORY_LOG_FILE)
+        writes.append((MEMORY_FILE, list(AETHER_MEMORY), next(_write_seq)))
 
     with strategic_lock:
         STRATEGIC_MEMORY.clear()
         STRATEGIC_MEMORY.update(strat if isinstance(strat, dict) else {"patterns": {}, "failures": {}, "history": [], "last_update": None})
-        save_json_atomic(STRATEGIC_FILE, STRATEGIC_MEMORY)
+        writes.append((STRATEGIC_FILE, dict(STRATEGIC_MEMORY), next(_write_seq)))
 
     with log_lock:
         AETHER_LOGS.clear()
         if isinstance(logs, list):
             AETHER_LOGS.extend(logs)
-        save_json_atomic(LOG_FILE, AETHER_LOGS)
+        _jsonl_reset(LOGS_LOG_FILE)
+        writes.append((LOG_FILE, list(AETHER_LOGS), next(_write_seq)))
 
     if demo1 is not None:
-        save_json_atomic(DEMO1_FILE, demo1)
+        writes.append((DEMO1_FILE, demo1, next(_write_seq)))
 
     snaps = bundle.get("snapshots", {}) or {}
     if isinstance(snaps, dict):
-        for sname, snap_payload in snaps.items():
-            if sname and snap_payload:
-                save_json_atomic(_snapshot_path(str(sname)), snap_payload)
+        snap_writes = [
+            (_snapshot_path(str(sname)), snap_payload) for sname, snap_payload in snaps.items() if sname and snap_payload
+        ]
+        save_json_atomic_batch(snap_writes)
         _rebuild_snapshot_index()
 
     with projects_lock:
@@ -2260,14 +3332,18 @@ def replica_apply(payload: Dict[str, Any]) -> Dict[str, Any]:
             AETHER_PROJECTS.extend(projects)
         else:
             AETHER_PROJECTS.extend(list(DEFAULT_PROJECTS))
-        save_json_atomic(PROJECTS_FILE, AETHER_PROJECTS)
+        _jsonl_reset(PROJECTS_LOG_FILE)
+        writes.append((PROJECTS_FILE, list(AETHER_PROJECTS), next(_write_seq)))
 
     with tasks_lock:
         AETHER_TASKS.clear()
         if isinstance(tasks, list):
             AETHER_TASKS.extend(tasks)
         _normalize_tasks_locked()
-        save_json_atomic(TASKS_FILE, AETHER_TASKS)
+        _jsonl_reset(TASKS_LOG_FILE)
+        writes.append((TASKS_FILE, list(AETHER_TASKS), next(_write_seq)))
+
+    save_json_atomic_batch(writes)
 
     if isinstance(plugins, dict) and isinstance(plugins.get("files"), dict):
         res = snapshot_apply_plugins(plugins["files"])
@@ -2280,21 +3356,26 @@ def replica_apply(payload: Dict[str, Any]) -> Dict[str, Any]:
 
 def replica_import(replica_json_text: str, apply_now: bool = True) -> Dict[str, Any]:
     try:
-        payload = json.loads(replica_json_text or "")
+        payload = _json_loads(replica_json_text or "")
         if not isinstance(payload, dict) or not payload.get("ok"):
             return {"ok": False, "error": "invalid_payload"}
         if payload.get("format") != REPLICA_FORMAT:
             return {"ok": False, "error": "invalid_format", "expected": REPLICA_FORMAT, "got": payload.get("format")}
 
-        checksum = payload.get("checksum_sha256")
+        algo = "blake3" if "checksum_blake3" in payload else "sha256"
+        checksum = payload.get("checksum_" + algo)
         if not checksum or not isinstance(checksum, str):
             return {"ok": False, "error": "missing_checksum"}
+        if algo == "blake3" and blake3 is None:
+            return {"ok": False, "error": "checksum_algo_unavailable", "algo": algo}
 
         copy = dict(payload)
-        copy.pop("checksum_sha256", None)
-        txt = json.dumps(copy, indent=2, ensure_ascii=False, sort_keys=True)
-        if sha256_text(txt) != checksum:
-            return {"ok": False, "error": "checksum_mismatch"}
+        copy.pop("checksum_" + algo, None)
+        if _replica_digest(_json_dumps_pretty_bytes(copy, sort_keys=True), algo) != checksum:
+            # replicas exportadas con json stdlib pueden diferir en floats: reintentar canonico stdlib
+            raw = _UI_ENCODE_SORTED(copy).encode("utf-8")
+            if _replica_digest(raw, algo) != checksum:
+                return {"ok": False, "error": "checksum_mismatch"}
 
         if apply_now:
             return replica_apply(payload)
@@ -2326,6 +3407,7 @@ def _normalize_task(task: Dict[str, Any]) -> None:
 def _normalize_tasks_locked() -> None:
     for t in AETHER_TASKS:
         _normalize_task(t)
+    _rebuild_task_status_counts_locked()
 
 def ensure_projects() -> None:
     with projects_lock:
@@ -2355,7 +3437,10 @@ def add_project(name: str) -> Dict[str, Any]:
     proj = {"id": pid, "name": name, "created_at": safe_now()}
     with projects_lock:
         AETHER_PROJECTS.append(proj)
-        save_json_atomic(PROJECTS_FILE, AETHER_PROJECTS)
+        if _jsonl_append(PROJECTS_LOG_FILE, proj):
+            _jsonl_maybe_compact(PROJECTS_FILE, PROJECTS_LOG_FILE, AETHER_PROJECTS)
+        else:
+            save_json_atomic_async(PROJECTS_FILE, AETHER_PROJECTS)
     log_event("PROJECT_CREATED", {"id": pid, "name": name})
     update_dashboard()
     return {"ok": True, "project": proj}
@@ -2384,7 +3469,11 @@ def add_task(project_id: str, command: str) -> Dict[str, Any]:
     }
     with tasks_lock:
         AETHER_TASKS.append(task)
-        save_json_atomic(TASKS_FILE, AETHER_TASKS)
+        TASK_STATUS_COUNTS["PENDING"] += 1
+        if _jsonl_append(TASKS_LOG_FILE, task):
+            _jsonl_maybe_compact(TASKS_FILE, TASKS_LOG_FILE, AETHER_TASKS)
+        else:
+            save_json_atomic_async(TASKS_FILE, AETHER_TASKS)
     log_event("PROJECT_TASK_CREATED", {"id": tid, "project_id": project_id})
     update_dashboard()
     return {"ok": True, "task": task}
@@ -2414,15 +3503,20 @@ def can_run_project_task(task: Dict[str, Any]) -> Tuple[bool, str]:
 # ROUTING / EXECUTION
 # -----------------------------
 
+DOMAIN_KEYWORDS: Dict[str, str] = {
+    "física": "science", "ecuación": "science", "modelo": "science", "simulación": "science", "simular": "science",
+    "reload": "ai", "plugin": "ai", "plugins": "ai", "task ": "ai",
+    "snapshot": "persistence", "snap": "persistence", "restore": "persistence",
+    "export": "persistence", "import": "persistence", "replica": "persistence",
+}
+# Un solo automata para todas las keywords (lookahead => coincidencias solapadas en un pase)
+_DOMAIN_RE = re.compile(
+    "(?=(" + "|".join(re.escape(k) for k in sorted(DOMAIN_KEYWORDS, key=len, reverse=True)) + "))"
+)
+
 def detect_domains(command: str) -> List[str]:
     c = (command or "").lower()
-    d = set()
-    if any(k in c for k in ["física", "ecuación", "modelo", "simulación", "simular"]):
-        d.add("science")
-    if any(k in c for k in ["reload", "plugin", "plugins", "task "]):
-        d.add("ai")
-    if any(k in c for k in ["snapshot", "snap", "restore", "export", "import", "replica"]):
-        d.add("persistence")
+    d = {DOMAIN_KEYWORDS[m] for m in _DOMAIN_RE.findall(c)}
     return list(d) or ["general"]
 
 def decide_engine(command: str, domains: List[str]) -> Dict[str, Any]:
@@ -2436,15 +3530,16 @@ def decide_engine(command: str, domains: List[str]) -> Dict[str, Any]:
 
 REPLAY_SNAPSHOT_WINDOW_SEC = 15 * 60
 
-def _copy_memory_entries() -> List[Dict[str, Any]]:
-    # Copy under lock so replay reads a consistent view without blocking writers for long.
+def _lookup_memory_entry(task_id: str) -> Optional[Dict[str, Any]]:
+    # Scan in place under lock: entries are never mutated after append, so handing
+    # out the matching dict is safe and avoids copying the whole list per replay.
     with memory_lock:
-        return list(AETHER_MEMORY)
+        return _find_memory_entry(task_id, AETHER_MEMORY)
 
-def _copy_log_entries() -> List[Dict[str, Any]]:
-    # Copy under lock to avoid replay racing with log appenders.
+def _lookup_log_command(task_id: str) -> Optional[str]:
+    # Same as above for logs; only reached when memory has no command for the task.
     with log_lock:
-        return list(AETHER_LOGS)
+        return _find_log_command(task_id, AETHER_LOGS)
 
 def _find_memory_entry(task_id: str, memory_entries: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
     for entry in memory_entries:
@@ -2497,8 +3592,11 @@ def _memory_entry_from_snapshot(payload: Dict[str, Any], task_id: str) -> Option
 
 def _decision_diff(original: Dict[str, Any], replayed: Dict[str, Any]) -> Dict[str, Any]:
     diff: Dict[str, Any] = {}
-    keys = set(original.keys()) | set(replayed.keys())
-    for key in sorted(keys):
+    # decision dicts are tiny (mode/confidence): a list merge beats building three sets
+    keys = list(original)
+    keys.extend(k for k in replayed if k not in original)
+    keys.sort()
+    for key in keys:
         if original.get(key) != replayed.get(key):
             diff[key] = {"original": original.get(key), "replayed": replayed.get(key)}
     return diff
@@ -2509,18 +3607,16 @@ def replay_task(task_id: str, dry_run: bool = True) -> Dict[str, Any]:
         return {"ok": False, "error": "task_id_required"}
 
     # Replay never executes commands to preserve audit safety across environments.
-    memory_entries = _copy_memory_entries()
-    log_entries = _copy_log_entries()
-    memory_entry = _find_memory_entry(task_id, memory_entries)
+    memory_entry = _lookup_memory_entry(task_id)
     command = memory_entry.get("command") if memory_entry else None
 
     if not isinstance(command, str) or not command.strip():
-        command = _find_log_command(task_id, log_entries)
+        command = _lookup_log_command(task_id)
 
     if not isinstance(command, str) or not command.strip():
         return {"ok": False, "error": "task_not_found"}
 
-    original_ts = _parse_iso_ts(memory_entry.get("timestamp")) if isinstance(memory_entry, dict) else None
+    original_ts = _entry_epoch(memory_entry, "_ts", "timestamp") if isinstance(memory_entry, dict) else None
     snapshot_payload, snapshot_info = _find_snapshot_for_replay(original_ts)
 
     if memory_entry is None and snapshot_payload:
@@ -2580,13 +3676,12 @@ def replay_task(task_id: str, dry_run: bool = True) -> Dict[str, Any]:
 def _is_plan_command(command: str) -> bool:
     return (command or "").strip().lower().startswith("plan:")
 
+_STATUS_RE = re.compile("status|estado")
+
 def _is_status_command(command: str) -> bool:
+    # every exact alias ("estado interno", "review internal status", ...) contains one of the stems
     cmd = (command or "").strip().lower()
-    if not cmd:
-        return False
-    if cmd in {"status", "estado", "estado interno", "internal status", "review internal status", "revisar status interno"}:
-        return True
-    return "status" in cmd or "estado" in cmd
+    return bool(cmd) and _STATUS_RE.search(cmd) is not None
 
 def _clean_plan_subject(command: str) -> str:
     raw = (command or "").strip()
@@ -2594,16 +3689,14 @@ def _clean_plan_subject(command: str) -> str:
         raw = raw[5:]
     return raw.strip()
 
+_PLAN_WS_TABLE = str.maketrans("\n\t", "  ")
+_PLAN_SPLIT_RE = re.compile(r"[.;]")
+
 def _split_plan_items(subject: str) -> List[str]:
     if not subject:
         return []
-    normalized = subject.replace("\n", " ").replace("\t", " ")
-    parts: List[str] = []
-    for chunk in normalized.split(";"):
-        chunk = chunk.strip()
-        if not chunk:
-            continue
-        parts.extend([c.strip() for c in chunk.split(".") if c.strip()])
+    parts = [p.strip() for p in _PLAN_SPLIT_RE.split(subject.translate(_PLAN_WS_TABLE))]
+    parts = [p for p in parts if p]
     if not parts:
         parts = [subject.strip()]
     return parts
@@ -2641,6 +3734,16 @@ def execute(command: str, decision: Dict[str, Any]) -> Dict[str, Any]:
         return execute_ai_module(command)
     return execute_general(command)
 
+def _spend_energy_locked(cost: int) -> None:
+    # Caller holds state_lock: a single int cast per critical section.
+    e = int(AETHER_STATE.get("energy", 0)) - cost
+    if e < 0:
+        e = 0
+    AETHER_STATE["energy"] = e
+    AETHER_STATE["last_cycle"] = safe_now()
+    AETHER_STATE["last_cycle_ts"] = time.time()
+    AETHER_STATE["focus"] = "RECOVERY" if e < 20 else "ACTIVE"
+
 def obedient_execution(command: str, decision: Dict[str, Any]) -> Dict[str, Any]:
     if KILL_SWITCH.get("status") != "ARMED":
         return {"success": False, "error": "SYSTEM_HALTED"}
@@ -2650,13 +3753,12 @@ def obedient_execution(command: str, decision: Dict[str, Any]) -> Dict[str, Any]
         return {"success": False, "error": "ROOT_GOAL_VIOLATION"}
 
     with state_lock:
-        AETHER_STATE["energy"] = max(0, int(AETHER_STATE.get("energy", 0)) - 1)
-        AETHER_STATE["last_cycle"] = safe_now()
-        AETHER_STATE["focus"] = "RECOVERY" if int(AETHER_STATE.get("energy", 0)) < 20 else "ACTIVE"
-        save_json_atomic(STATE_FILE, AETHER_STATE)
+        _spend_energy_locked(1)
+        mark_dirty(STATE_FILE, AETHER_STATE)
 
     return execute(command, decision)
 
+@_now_scoped
 def run_now(
     command: str,
     source: str = "chat",
@@ -2689,17 +3791,14 @@ def run_now(
         return {"mode": "blocked"}, {"success": False, "error": "STABILITY_PAUSED"}
     allowed, reason, specials = _trust_zone_allowed(zone, inferred_type, command)
     if not allowed:
-        log_event(
-            "TRUST_ZONE_BLOCK_EXEC",
-            {
-                "command": command,
-                "source": source,
-                "origin": origin,
-                "zone": zone,
-                "task_type": inferred_type,
-                "reason": reason,
-                "special": specials,
-            },
+        _log_trust_block(
+            command=command,
+            source=source,
+            origin=origin,
+            zone=zone,
+            task_type=inferred_type,
+            reason=reason,
+            special=specials,
         )
         update_dashboard()
         return {"mode": "blocked"}, {"success": False, "error": "TRUST_ZONE_BLOCKED"}
@@ -2713,18 +3812,19 @@ def run_now(
         with memory_lock:
             AETHER_MEMORY.append(
                 {
-                    "task_id": str(uuid.uuid4()),
+                    "task_id": secrets.token_hex(16),
                     "command": command,
                     "domains": ["planner"],
                     "decision": decision,
                     "results": [result],
                     "timestamp": safe_now(),
+                    "_ts": time.time(),
                     "source": source,
                 }
             )
             if len(AETHER_MEMORY) > MAX_MEMORY_ENTRIES:
                 AETHER_MEMORY[:] = AETHER_MEMORY[-MAX_MEMORY_ENTRIES:]
-            save_json_atomic(MEMORY_FILE, AETHER_MEMORY)
+            _memory_log_append_locked()
 
         log_event("PLANNER_RUN", {"command": command, "subtasks": len(subtasks)})
         update_dashboard()
@@ -2739,6 +3839,7 @@ def run_now(
     decision = decide_engine(command, domains)
 
     result = obedient_execution(command, decision)
+    now_scope_advance()
     success = bool(result.get("success"))
 
     record_strategy(command, decision.get("mode", "unknown"), success)
@@ -2746,18 +3847,19 @@ def run_now(
     with memory_lock:
         AETHER_MEMORY.append(
             {
-                "task_id": str(uuid.uuid4()),
+                "task_id": secrets.token_hex(16),
                 "command": command,
                 "domains": domains,
                 "decision": decision,
                 "results": [result],
                 "timestamp": safe_now(),
+                "_ts": time.time(),
                 "source": source,
             }
         )
         if len(AETHER_MEMORY) > MAX_MEMORY_ENTRIES:
             AETHER_MEMORY[:] = AETHER_MEMORY[-MAX_MEMORY_ENTRIES:]
-        save_json_atomic(MEMORY_FILE, AETHER_MEMORY)
+        _memory_log_append_locked()
 
     log_event("CHAT_RUN", {"command": command, "success": success, "mode": decision.get("mode")})
     update_dashboard()
@@ -2766,6 +3868,7 @@ def run_now(
 def run_project_task(task_id: str) -> Dict[str, Any]:
     task: Optional[Dict[str, Any]] = None
     with tasks_lock:
+        gen = TASK_STATUS_GEN[0]
         for t in AETHER_TASKS:
             if t.get("id") == task_id:
                 task = t
@@ -2780,7 +3883,7 @@ def run_project_task(task_id: str) -> Dict[str, Any]:
         return {"ok": False, "error": reason}
 
     with tasks_lock:
-        task["status"] = "RUNNING"
+        gen = _set_task_status_locked(task, "RUNNING", gen)
         save_json_atomic(TASKS_FILE, AETHER_TASKS)
 
     decision, result = run_now(
@@ -2798,10 +3901,10 @@ def run_project_task(task_id: str) -> Dict[str, Any]:
         task["last_result"] = result
         task["subtasks"] = subtasks
         if success:
-            task["status"] = "DONE"
+            _set_task_status_locked(task, "DONE", gen)
         else:
             task["retry_count"] = int(task.get("retry_count", 0)) + 1
-            task["status"] = "FAILED"
+            _set_task_status_locked(task, "FAILED", gen)
         save_json_atomic(TASKS_FILE, AETHER_TASKS)
 
     log_event("PROJECT_TASK_RUN", {"task_id": task_id, "success": success, "subtasks": len(subtasks)})
@@ -2854,38 +3957,86 @@ def _store_memory_event(task_id: str, command: str, decision: Dict[str, Any], re
                 "decision": decision,
                 "results": [result],
                 "timestamp": safe_now(),
+                "_ts": time.time(),
                 "source": source,
             }
         )
         if len(AETHER_MEMORY) > MAX_MEMORY_ENTRIES:
             AETHER_MEMORY[:] = AETHER_MEMORY[-MAX_MEMORY_ENTRIES:]
-        save_json_atomic(MEMORY_FILE, AETHER_MEMORY)
+        _memory_log_append_locked()
+
+# Level 42: isolated execution on a long-lived pool instead of one thread per task.
+WORKER_POOL_MAX = max(1, int(AETHER_TASK_BUDGET_MAX))
+WORKER_POOL = ThreadPoolExecutor(
+    max_workers=WORKER_POOL_MAX,
+    thread_name_prefix="aether-iso",
+)
+atexit.register(WORKER_POOL.shutdown, wait=False, cancel_futures=True)
+# Pool slots held by commands that are queued or running (a hung command keeps its slot
+# until it returns). worker_slots_lock.
+_WORKER_BUSY = [0]
+worker_slots_lock = threading.Lock()
+
+def _release_worker_slot() -> None:
+    with worker_slots_lock:
+        _WORKER_BUSY[0] = max(0, _WORKER_BUSY[0] - 1)
+
+def _run_isolated_started(command: str, started: threading.Event, pooled: bool) -> Dict[str, Any]:
+    started.set()
+    try:
+        return _run_isolated(command)
+    finally:
+        if pooled:
+            _release_worker_slot()
+
+def _submit_isolated(command: str) -> Tuple[Future, threading.Event, bool]:
+    # A pool slot is reserved before submitting, so a pooled command starts right away.
+    # When every slot is held by a hung command, the task gets its own daemon thread
+    # instead of queueing behind them (and timing out without ever running).
+    started = threading.Event()
+    with worker_slots_lock:
+        pooled = _WORKER_BUSY[0] < WORKER_POOL_MAX
+        if pooled:
+            _WORKER_BUSY[0] += 1
+    if pooled:
+        try:
+            return WORKER_POOL.submit(_run_isolated_started, command, started, True), started, True
+        except RuntimeError:
+            # pool already shut down (interpreter exit)
+            _release_worker_slot()
 
-class IsolatedWorker(threading.Thread):
-    def __init__(self, task: Dict[str, Any]):
-        super().__init__(daemon=True)
-        self.task = copy.deepcopy(task)
-        self.result: Dict[str, Any] = {}
+    fut: Future = Future()
 
-    def run(self) -> None:
+    def _runner() -> None:
+        if not fut.set_running_or_notify_cancel():
+            return
         try:
-            command = (self.task.get("command") or "").strip()
-            domains = detect_domains(command)
-            decision = decide_engine(command, domains)
-            execution = obedient_execution(command, decision)
-            self.result = {
-                "decision": decision,
-                "domains": domains,
-                "result": execution,
-                "error": None,
-            }
-        except Exception as e:
-            self.result = {
-                "decision": {"mode": "error"},
-                "domains": [],
-                "result": {"success": False, "error": str(e)},
-                "error": str(e),
-            }
+            fut.set_result(_run_isolated_started(command, started, False))
+        except BaseException as e:
+            fut.set_exception(e)
+
+    threading.Thread(target=_runner, name="aether-iso-overflow", daemon=True).start()
+    return fut, started, False
+
+def _run_isolated(command: str) -> Dict[str, Any]:
+    # Only the command string crosses into the worker: nothing shared can be mutated.
+    try:
+        domains = detect_domains(command)
+        decision = decide_engine(command, domains)
+        execution = obedient_execution(command, decision)
+        return {
+            "decision": decision,
+            "domains": domains,
+            "result": execution,
+            "error": None,
+        }
+    except Exception as e:
+        return {
+            "decision": {"mode": "error"},
+            "domains": [],
+            "result": {"success": False, "error": str(e)},
+            "error": str(e),
+        }
 
 def _preflight_execution(command: str) -> Optional[Dict[str, Any]]:
     if KILL_SWITCH.get("status") != "ARMED":
@@ -2896,139 +4047,142 @@ def _preflight_execution(command: str) -> Optional[Dict[str, Any]]:
         return {"success": False, "error": "ROOT_GOAL_VIOLATION"}
     return None
 
-def process_task(task: Dict[str, Any]) -> None:
-    command = (task.get("command") or "").strip()
-    task_id = task.get("id", "unknown")
-    task_type = (task.get("task_type") or "analysis").strip()
-    mode = _task_mode(task)
-    zone = (task.get("zone") or "").strip()
-    origin = task.get("origin")
-    stability = evaluate_stability()
-    stability_mode = stability.get("mode")
+# -----------------------------
+# TASK GATES (process_task)
+# -----------------------------
+# Each gate returns None to pass, or (error_code, optional (event_type, info) to log
+# before the failure). Evaluated in order; the first failure ends the task.
+
+def _trust_block_info(task: Dict[str, Any], ctx: Dict[str, Any], reason: str, **extra: Any) -> Dict[str, Any]:
+    return dict(
+        task_id=ctx["task_id"],
+        command=ctx["command"],
+        source=task.get("source"),
+        origin=ctx["origin"],
+        zone=ctx["zone"],
+        task_type=ctx["task_type"],
+        reason=reason,
+        **extra,
+    )
+
+def _gate_stability(task: Dict[str, Any], ctx: Dict[str, Any]) -> Optional[Tuple[str, Optional[Tuple[str, Dict[str, Any]]]]]:
+    stability_mode = evaluate_stability().get("mode")
     if stability_mode == "PAUSED":
-        allow_internal = zone == "INTERNAL" and task_type == "read_only"
+        allow_internal = ctx["zone"] == "INTERNAL" and ctx["task_type"] == "read_only"
         if not allow_internal:
-            result = {"success": False, "error": f"STABILITY_{stability_mode}"}
-            decision = {"mode": "blocked"}
-            _store_memory_event(task_id, command, decision, result, task.get("source", "queue"))
-            log_event("TASK_FAILED", {"task_id": task_id, "command": command, "error": f"STABILITY_{stability_mode}"})
-            update_dashboard()
-            return
+            return f"STABILITY_{stability_mode}", None
+    return None
 
-    if zone not in TRUST_ZONES:
-        result = {"success": False, "error": "INVALID_ZONE"}
-        decision = {"mode": "blocked"}
-        log_event(
-            "TRUST_ZONE_BLOCK_EXEC",
-            {
-                "task_id": task_id,
-                "command": command,
-                "source": task.get("source"),
-                "origin": origin,
-                "zone": zone,
-                "task_type": task_type,
-                "reason": "missing_or_invalid_zone",
-            },
-        )
-        _store_memory_event(task_id, command, decision, result, task.get("source", "queue"))
-        log_event("TASK_FAILED", {"task_id": task_id, "command": command, "error": "INVALID_ZONE"})
-        update_dashboard()
-        return
+def _gate_zone_known(task: Dict[str, Any], ctx: Dict[str, Any]) -> Optional[Tuple[str, Optional[Tuple[str, Dict[str, Any]]]]]:
+    if ctx["zone"] in TRUST_ZONES:
+        return None
+    return "INVALID_ZONE", ("TRUST_ZONE_BLOCK_EXEC", _trust_block_info(task, ctx, "missing_or_invalid_zone"))
 
-    resolved_zone = resolve_zone(task.get("source", ""), origin)
-    if resolved_zone != zone:
-        result = {"success": False, "error": "ZONE_MISMATCH"}
-        decision = {"mode": "blocked"}
-        log_event(
-            "TRUST_ZONE_BLOCK_EXEC",
-            {
-                "task_id": task_id,
-                "command": command,
-                "source": task.get("source"),
-                "origin": origin,
-                "zone": zone,
-                "resolved_zone": resolved_zone,
-                "task_type": task_type,
-                "reason": "zone_mismatch",
-            },
-        )
-        _store_memory_event(task_id, command, decision, result, task.get("source", "queue"))
-        log_event("TASK_FAILED", {"task_id": task_id, "command": command, "error": "ZONE_MISMATCH"})
-        update_dashboard()
-        return
+def _gate_zone_match(task: Dict[str, Any], ctx: Dict[str, Any]) -> Optional[Tuple[str, Optional[Tuple[str, Dict[str, Any]]]]]:
+    # always from source/origin: zone is a task field, so it can't vouch for itself
+    resolved_zone = resolve_zone(task.get("source", ""), ctx["origin"])
+    if resolved_zone == ctx["zone"]:
+        return None
+    return "ZONE_MISMATCH", (
+        "TRUST_ZONE_BLOCK_EXEC",
+        _trust_block_info(task, ctx, "zone_mismatch", resolved_zone=resolved_zone),
+    )
 
-    allowed, reason, specials = _trust_zone_allowed(zone, task_type, command)
-    if not allowed:
-        result = {"success": False, "error": "TRUST_ZONE_BLOCKED"}
-        decision = {"mode": "blocked"}
-        log_event(
-            "TRUST_ZONE_BLOCK_EXEC",
-            {
-                "task_id": task_id,
-                "command": command,
-                "source": task.get("source"),
-                "origin": origin,
-                "zone": zone,
-                "task_type": task_type,
-                "reason": reason,
-                "special": specials,
-            },
-        )
-        _store_memory_event(task_id, command, decision, result, task.get("source", "queue"))
-        log_event("TASK_FAILED", {"task_id": task_id, "command": command, "error": "TRUST_ZONE_BLOCKED"})
-        update_dashboard()
-        return
+def _gate_trust_zone(task: Dict[str, Any], ctx: Dict[str, Any]) -> Optional[Tuple[str, Optional[Tuple[str, Dict[str, Any]]]]]:
+    allowed, reason, specials = _trust_zone_allowed(ctx["zone"], ctx["task_type"], ctx["command"])
+    if allowed:
+        return None
+    return "TRUST_ZONE_BLOCKED", ("TRUST_ZONE_BLOCK_EXEC", _trust_block_info(task, ctx, reason, special=specials))
 
+def _gate_permission(task: Dict[str, Any], ctx: Dict[str, Any]) -> Optional[Tuple[str, Optional[Tuple[str, Dict[str, Any]]]]]:
     # Level 40: Policy gate (task_type permissions)
-    if not can_execute(task_type, mode):
-        result = {"success": False, "error": "PERMISSION_DENIED"}
-        decision = {"mode": "blocked"}
-        log_event("TASK_PERMISSION_DENIED", {"task_id": task_id, "task_type": task_type, "mode": mode})
-        _store_memory_event(task_id, command, decision, result, task.get("source", "queue"))
-        log_event("TASK_FAILED", {"task_id": task_id, "command": command, "error": "PERMISSION_DENIED"})
-        update_dashboard()
-        return
+    if can_execute(ctx["task_type"], ctx["mode"]):
+        return None
+    return "PERMISSION_DENIED", (
+        "TASK_PERMISSION_DENIED",
+        {"task_id": ctx["task_id"], "task_type": ctx["task_type"], "mode": ctx["mode"]},
+    )
 
+def _gate_signature(task: Dict[str, Any], ctx: Dict[str, Any]) -> Optional[Tuple[str, Optional[Tuple[str, Dict[str, Any]]]]]:
     # Level 41: Integrity gate (HMAC signature)
-    if not verify_task(task):
-        result = {"success": False, "error": "INVALID_SIGNATURE"}
-        decision = {"mode": "blocked"}
-        log_event("TASK_INVALID_SIGNATURE", {"task_id": task_id})
-        _store_memory_event(task_id, command, decision, result, task.get("source", "queue"))
-        log_event("TASK_FAILED", {"task_id": task_id, "command": command, "error": "INVALID_SIGNATURE"})
-        update_dashboard()
-        return
+    if verify_task(task):
+        return None
+    return "INVALID_SIGNATURE", ("TASK_INVALID_SIGNATURE", {"task_id": ctx["task_id"]})
 
-    preflight_error = _preflight_execution(command)
-    if preflight_error:
-        decision = {"mode": "blocked"}
-        _store_memory_event(task_id, command, decision, preflight_error, task.get("source", "queue"))
-        log_event("TASK_FAILED", {"task_id": task_id, "command": command, "error": preflight_error.get("error")})
-        update_dashboard()
-        return
+def _gate_preflight(task: Dict[str, Any], ctx: Dict[str, Any]) -> Optional[Tuple[str, Optional[Tuple[str, Dict[str, Any]]]]]:
+    preflight_error = _preflight_execution(ctx["command"])
+    if not preflight_error:
+        return None
+    return preflight_error.get("error"), None
+
+TASK_GATES = (
+    _gate_stability,
+    _gate_zone_known,
+    _gate_zone_match,
+    _gate_trust_zone,
+    _gate_permission,
+    _gate_signature,
+    _gate_preflight,
+)
+
+def _fail_task(task: Dict[str, Any], ctx: Dict[str, Any], error: Optional[str], event: Optional[Tuple[str, Dict[str, Any]]]) -> None:
+    # Single failure path for every gate: gate event, memory entry, TASK_FAILED.
+    if event is not None:
+        log_event(event[0], event[1])
+    result = {"success": False, "error": error}
+    _store_memory_event(ctx["task_id"], ctx["command"], {"mode": "blocked"}, result, task.get("source", "queue"))
+    log_event("TASK_FAILED", {"task_id": ctx["task_id"], "command": ctx["command"], "error": error})
+    update_dashboard()
+
+@_now_scoped
+def process_task(task: Dict[str, Any]) -> None:
+    command = (task.get("command") or "").strip()
+    task_id = task.get("id", "unknown")
+    task_type = (task.get("task_type") or "analysis").strip()
+    mode = _task_mode(task)
+    ctx = {
+        "command": command,
+        "task_id": task_id,
+        "task_type": task_type,
+        "mode": mode,
+        "zone": (task.get("zone") or "").strip(),
+        "origin": task.get("origin"),
+    }
+    for gate in TASK_GATES:
+        failed = gate(task, ctx)
+        if failed is not None:
+            _fail_task(task, ctx, failed[0], failed[1])
+            return
 
     with state_lock:
         AETHER_STATE["status"] = "WORKING"
-        AETHER_STATE["energy"] = max(0, int(AETHER_STATE.get("energy", 0)) - 1)
-        AETHER_STATE["last_cycle"] = safe_now()
-        AETHER_STATE["focus"] = "RECOVERY" if int(AETHER_STATE.get("energy", 0)) < 20 else "ACTIVE"
-        save_json_atomic(STATE_FILE, AETHER_STATE)
+        _spend_energy_locked(1)
+        mark_dirty(STATE_FILE, AETHER_STATE)
 
     log_event("TASK_START", {"task_id": task_id, "command": command, "task_type": task_type, "mode": mode})
 
-    # Level 42: Isolated worker with deepcopy + timeout
-    worker = IsolatedWorker(task)
-    worker.start()
+    # Level 42: Isolated worker (immutable command only) + timeout
+    fut, started, pooled = _submit_isolated(command)
     timeout = max(1, int(AETHER_TASK_TIMEOUT_SEC))
-    worker.join(timeout)
-
-    if worker.is_alive():
+    out = None
+    # the timeout counts run time only: it starts once the worker has picked the command up
+    if started.wait(timeout):
+        try:
+            out = fut.result(timeout=timeout)
+        except FuturesTimeoutError:
+            out = None
+    if out is None and fut.cancel() and pooled:
+        # never started: the reserved slot would otherwise stay held
+        _release_worker_slot()
+    now_scope_advance()
+
+    if out is None:
         decision = {"mode": "timeout"}
         result = {"success": False, "error": "TIMEOUT"}
         log_event("TASK_TIMEOUT", {"task_id": task_id, "timeout_sec": timeout})
     else:
-        decision = worker.result.get("decision") or {"mode": "unknown"}
-        result = worker.result.get("result") or {"success": False, "error": "NO_RESULT"}
+        decision = out.get("decision") or {"mode": "unknown"}
+        result = out.get("result") or {"success": False, "error": "NO_RESULT"}
 
     success = bool(result.get("success"))
     record_strategy(command, decision.get("mode", "unknown"), success)
@@ -3057,47 +4211,41 @@ def _next_pending_task_id() -> Optional[str]:
 def _recent_error_stats(now_ts: float) -> Tuple[int, int]:
     window_start = now_ts - THROTTLE_ERROR_WINDOW_SEC
     burst_start = now_ts - THROTTLE_BURST_WINDOW_SEC
-    recent_errors = 0
-    burst_errors = 0
-    with log_lock:
-        entries = list(AETHER_LOGS)
-    for entry in reversed(entries):
-        ts = entry.get("timestamp")
-        if not isinstance(ts, str):
-            continue
-        try:
-            entry_ts = datetime.fromisoformat(ts).timestamp()
-        except Exception:
-            continue
-        if entry_ts < window_start:
-            break
-        if entry.get("type") in THROTTLE_ERROR_TYPES:
-            recent_errors += 1
-            if entry_ts >= burst_start:
-                burst_errors += 1
-    return recent_errors, burst_errors
-
-def _compute_throttle_health() -> Tuple[float, List[str], bool]:
-    reasons: List[str] = []
-    now_ts = time.time()
+    with recent_error_lock:
+        while RECENT_ERROR_TS and RECENT_ERROR_TS[0][0] < window_start:
+            RECENT_ERROR_TS.popleft()
+        while BURST_ERROR_TS and BURST_ERROR_TS[0][0] < burst_start:
+            BURST_ERROR_TS.popleft()
+        return len(RECENT_ERROR_TS), len(BURST_ERROR_TS)
+
+def _throttle_inputs(now_ts: float, flags: Optional[Tuple[bool, bool]] = None) -> Tuple[int, int, int, int, bool, bool]:
+    # flags: (safe_mode, frozen) already read by the caller's tick
     recent_errors, burst_errors = _recent_error_stats(now_ts)
+    with state_lock:
+        energy = int(AETHER_STATE.get("energy", 0))
+    if flags is None:
+        flags = (safe_mode_enabled(), is_frozen())
+    return recent_errors, burst_errors, task_queue_size(), energy, flags[0], flags[1]
+
+def _compute_throttle_health(inputs: Optional[Tuple[int, int, int, int, bool, bool]] = None) -> Tuple[float, List[str], bool]:
+    reasons: List[str] = []
+    if inputs is None:
+        inputs = _throttle_inputs(time.time())
+    recent_errors, burst_errors, queue_size, energy, safe_mode, frozen = inputs
     if recent_errors:
         reasons.append(f"errors_last_{THROTTLE_ERROR_WINDOW_SEC}s:{recent_errors}")
     if burst_errors:
         reasons.append(f"errors_last_{THROTTLE_BURST_WINDOW_SEC}s:{burst_errors}")
 
-    queue_size = TASK_QUEUE.qsize()
     if queue_size:
         reasons.append(f"queue:{queue_size}")
 
-    with state_lock:
-        energy = int(AETHER_STATE.get("energy", 0))
     if energy < 40:
         reasons.append(f"energy:{energy}")
 
-    if safe_mode_enabled():
+    if safe_mode:
         reasons.append("safe_mode")
-    if is_frozen():
+    if frozen:
         reasons.append("freeze")
 
     score = 1.0
@@ -3105,9 +4253,9 @@ def _compute_throttle_health() -> Tuple[float, List[str], bool]:
     score -= min(0.25, max(0, queue_size - 2) * 0.03)
     if energy < 60:
         score -= min(0.3, (60 - energy) * 0.01)
-    if safe_mode_enabled():
+    if safe_mode:
         score -= 0.2
-    if is_frozen():
+    if frozen:
         score -= 0.2
     score = _clamp(score, 0.1, 1.0)
     burst = burst_errors >= THROTTLE_BURST_COUNT
@@ -3116,9 +4264,23 @@ def _compute_throttle_health() -> Tuple[float, List[str], bool]:
 def _step_toward(current: float, target: float, step_frac: float = 0.2) -> float:
     return current + (target - current) * step_frac
 
-def update_throttle_state() -> Dict[str, Any]:
+# (inputs, valid_until): skip the step while the inputs are unchanged and the
+# controller is at a fixed point (no pending step-up, cooldown or periodic log).
+_THROTTLE_CACHE: Optional[Tuple[Tuple[int, int, int, int, bool, bool], float]] = None
+
+def update_throttle_state(flags: Optional[Tuple[bool, bool]] = None) -> ThrottleSnapshot:
+    _throttle_step(flags)
+    return THROTTLE_SNAPSHOT
+
+def _throttle_step(flags: Optional[Tuple[bool, bool]] = None) -> None:
+    # Runs the controller; results land in THROTTLE_STATE and the EFFECTIVE_* globals.
+    global _THROTTLE_CACHE, EFFECTIVE_BUDGET, EFFECTIVE_TICK, EFFECTIVE_SCHED, EFFECTIVE_HB, THROTTLE_SNAPSHOT
     now_ts = time.time()
-    score, reasons, burst = _compute_throttle_health()
+    inputs = _throttle_inputs(now_ts, flags)
+    cache = _THROTTLE_CACHE
+    if cache is not None and cache[0] == inputs and now_ts < cache[1]:
+        return
+    score, reasons, burst = _compute_throttle_health(inputs)
     scale = _clamp(score, 0.2, 1.0)
 
     base_budget = max(1, int(AETHER_TASK_BUDGET))
@@ -3237,6 +4399,12 @@ def update_throttle_state() -> Dict[str, Any]:
                 },
             )
 
+        if (
+            changed
+            or THROTTLE_STATE.get("score") != round(score, 3)
+            or THROTTLE_STATE.get("reasons") != reasons
+        ):
+            _bump_status_version()
         THROTTLE_STATE.update(
             {
                 "score": round(score, 3),
@@ -3250,15 +4418,44 @@ def update_throttle_state() -> Dict[str, Any]:
                 "reasons": reasons,
             }
         )
-        return dict(THROTTLE_STATE)
+        settled = (
+            not changed
+            and mode == "normal"
+            and (
+                score < THROTTLE_UP_THRESHOLD
+                or (
+                    current_budget >= target_budget
+                    and current_tick <= target_tick
+                    and current_sched <= target_sched
+                    and current_heartbeat <= target_heartbeat
+                )
+            )
+        )
+        if settled:
+            valid_until = float(THROTTLE_STATE.get("last_state_log_ts") or 0.0) + THROTTLE_STATE_LOG_SEC
+            _THROTTLE_CACHE = (inputs, valid_until)
+        else:
+            _THROTTLE_CACHE = None
+        THROTTLE_SNAPSHOT = ThrottleSnapshot(
+            mode, round(score, 3), current_budget, current_tick, current_sched, current_heartbeat
+        )
+    EFFECTIVE_BUDGET = current_budget
+    EFFECTIVE_TICK = current_tick
+    EFFECTIVE_SCHED = current_sched
+    EFFECTIVE_HB = current_heartbeat
 
 def task_worker() -> None:
     while not STOP_EVENT.is_set():
         try:
-            if safe_mode_enabled():
+            # persist whatever the previous tick (or run_now) left dirty
+            flush_dirty()
+            # one read of the mode flags per tick, reused by the throttle
+            safe_mode = safe_mode_enabled()
+            frozen = is_frozen()
+            if safe_mode:
                 with state_lock:
                     AETHER_STATE["status"] = "SAFE_MODE"
-                    save_json_atomic(STATE_FILE, AETHER_STATE)
+                    mark_dirty(STATE_FILE, AETHER_STATE)
                 update_dashboard()
                 time.sleep(1.0)
                 continue
@@ -3267,20 +4464,23 @@ def task_worker() -> None:
                 time.sleep(1.0)
                 continue
 
-            if is_frozen():
+            if frozen:
                 with state_lock:
                     AETHER_STATE["status"] = "FROZEN"
-                    save_json_atomic(STATE_FILE, AETHER_STATE)
+                    mark_dirty(STATE_FILE, AETHER_STATE)
                 update_dashboard()
                 time.sleep(1.0)
                 continue
 
-            throttle = update_throttle_state()
-            budget = max(1, int(throttle.get("effective_budget", AETHER_TASK_BUDGET)))
+            _throttle_step((safe_mode, frozen))
+            budget = max(1, EFFECTIVE_BUDGET)
+            tick_sleep = max(WORKER_TICK_MIN_SEC, EFFECTIVE_TICK)
             processed = 0
 
-            while processed < budget and not TASK_QUEUE.empty():
-                _, task = TASK_QUEUE.get()
+            # Block up to one tick for the first task (wakes as soon as work arrives),
+            # then drain without waiting up to the budget.
+            task = _task_heap_pop(tick_sleep)
+            while task is not None:
                 # GUARD 47.2: anti-freeze del loop, continuar si algo falla
                 try:
                     try:
@@ -3292,34 +4492,37 @@ def task_worker() -> None:
                             pass
                 finally:
                     with queue_lock:
-                        QUEUE_SET.discard((task.get("command") or "").strip())
-                    TASK_QUEUE.task_done()
+                        QUEUE_SET.discard(_cmd_key((task.get("command") or "").strip()))
                 processed += 1
+                if processed >= budget:
+                    break
+                task = _task_heap_pop()
 
             if processed == 0:
                 with state_lock:
                     AETHER_STATE["status"] = "IDLE"
-                    save_json_atomic(STATE_FILE, AETHER_STATE)
+                    mark_dirty(STATE_FILE, AETHER_STATE)
 
+            flush_dirty()
             update_dashboard()
-            tick_sleep = float(throttle.get("effective_tick_sec", BASE_WORKER_TICK_SEC))
-            time.sleep(max(WORKER_TICK_MIN_SEC, tick_sleep))
+            if processed >= budget:
+                # budget exhausted: keep the throttle's rate limit
+                time.sleep(tick_sleep)
         except Exception as e:
             log_event("WORKER_ERROR", {"error": str(e)})
             time.sleep(1.0)
+    flush_dirty()
 
 def scheduler_loop() -> None:
     while not STOP_EVENT.is_set():
         try:
-            if safe_mode_enabled():
-                time.sleep(1.0)
-                continue
-
-            if is_frozen():
+            safe_mode = safe_mode_enabled()
+            frozen = is_frozen()
+            if safe_mode or frozen:
                 time.sleep(1.0)
                 continue
-            throttle = update_throttle_state()
-            heartbeat_interval = int(throttle.get("effective_heartbeat_interval", HEARTBEAT_INTERVAL_SEC))
+            _throttle_step((safe_mode, frozen))
+            heartbeat_interval = EFFECTIVE_HB
 
             # heartbeat enqueue
             if AETHER_HEARTBEAT_ENABLED:
@@ -3339,16 +4542,15 @@ def scheduler_loop() -> None:
                     if isinstance(r, dict) and r.get("ok"):
                         with state_lock:
                             AETHER_STATE["last_heartbeat_ts"] = now_ts
-                            save_json_atomic(STATE_FILE, AETHER_STATE)
+                            mark_dirty(STATE_FILE, AETHER_STATE)
 
             with state_lock:
-                AETHER_STATE["last_cycle"] = safe_now()
-                AETHER_STATE["focus"] = "RECOVERY" if int(AETHER_STATE.get("energy", 0)) < 20 else "ACTIVE"
-                save_json_atomic(STATE_FILE, AETHER_STATE)
+                _spend_energy_locked(0)
+                mark_dirty(STATE_FILE, AETHER_STATE)
 
+            flush_dirty()
             update_dashboard()
-            sched_sleep = float(throttle.get("effective_sched_sleep_sec", BASE_SCHED_SLEEP_SEC))
-            time.sleep(max(SCHED_SLEEP_MIN_SEC, sched_sleep))
+            time.sleep(max(SCHED_SLEEP_MIN_SEC, EFFECTIVE_SCHED))
         except Exception as e:
             log_event("SCHEDULER_ERROR", {"error": str(e)})
             time.sleep(2.0)
@@ -3357,14 +4559,26 @@ def scheduler_loop() -> None:
 # WATCHDOG (stall detector)
 # -----------------------------
 
-def _parse_iso_ts(value: Optional[str]) -> Optional[float]:
-    if not value or not isinstance(value, str):
-        return None
+@functools.lru_cache(maxsize=8192)
+def _parse_iso_ts_cached(value: str) -> Optional[float]:
     try:
         return datetime.fromisoformat(value).timestamp()
     except Exception:
         return None
 
+def _parse_iso_ts(value: Optional[str]) -> Optional[float]:
+    # Timestamps repeat across replay/watchdog calls (snapshots, memory entries): memoize.
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_iso_ts_cached(value)
+
+def _entry_epoch(entry: Dict[str, Any], epoch_key: str, iso_key: str) -> Optional[float]:
+    # Prefer the epoch float stored at write time; parse ISO only for legacy entries.
+    ts = entry.get(epoch_key)
+    if isinstance(ts, (int, float)) and not isinstance(ts, bool):
+        return float(ts)
+    return _parse_iso_ts(entry.get(iso_key))
+
 def watchdog_loop() -> None:
     last_seen_cycle = None
     last_progress_ts = time.time()
@@ -3372,12 +4586,12 @@ def watchdog_loop() -> None:
         try:
             with state_lock:
                 current_cycle = AETHER_STATE.get("last_cycle")
+                last_cycle_ts = _entry_epoch(AETHER_STATE, "last_cycle_ts", "last_cycle")
             if current_cycle and current_cycle != last_seen_cycle:
                 last_seen_cycle = current_cycle
                 last_progress_ts = time.time()
 
             now_ts = time.time()
-            last_cycle_ts = _parse_iso_ts(current_cycle)
             elapsed_since_progress = now_ts - last_progress_ts
             elapsed_since_cycle = now_ts - last_cycle_ts if last_cycle_ts else elapsed_since_progress
 
@@ -3412,26 +4626,27 @@ def _detect_unclean_shutdown() -> Tuple[bool, str]:
     return False, "clean_shutdown"
 
 def _latest_snapshot_payload() -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
-    best_payload = None
-    best_key = None
-    best_ts = None
-    for name in snapshot_list():
-        payload = load_json(_snapshot_path(name), None)
-        if not isinstance(payload, dict) or not payload.get("ok"):
-            continue
-        created_ts = _parse_iso_ts(payload.get("created_at"))
-        if created_ts is None:
-            try:
-                created_ts = os.path.getmtime(_snapshot_path(name))
-            except Exception:
-                created_ts = None
-        if created_ts is None:
+    # Newest by file mtime (no ISO parsing, no reads); names that cannot be stat'ed
+    # go last in reverse lexicographic order. Parse newest-first, stop at the first valid.
+    by_mtime: List[Tuple[float, str]] = []
+    unstated: List[str] = []
+    for entry in _load_snapshot_index():
+        name = entry.get("name")
+        if not name:
             continue
-        if best_ts is None or created_ts > best_ts:
-            best_ts = created_ts
-            best_payload = payload
-            best_key = name
-    return best_payload, best_key
+        try:
+            by_mtime.append((os.path.getmtime(_snapshot_path(name)), name))
+        except Exception:
+            unstated.append(name)
+    by_mtime.sort(reverse=True)
+    unstated.sort(reverse=True)
+    for name in [n for _, n in by_mtime] + unstated:
+        payload = load_json(_snapshot_path(name), None)
+        if isinstance(payload, dict) and payload.get("ok"):
+            return payload, name
+    return None, None
+
+AETHER_RECOVERY_DEFER_FSYNC = os.environ.get("AETHER_RECOVERY_DEFER_FSYNC", "0") == "1"
 
 def _apply_recovery_payload(payload: Dict[str, Any]) -> None:
     files = payload.get("files", {}) if isinstance(payload, dict) else {}
@@ -3442,6 +4657,10 @@ def _apply_recovery_payload(payload: Dict[str, Any]) -> None:
     projects = files.get("projects", [])
     tasks = files.get("tasks", [])
 
+    # One batch for the six files: tmp files fsynced before the renames, then a single
+    # flush for the directory entries instead of one dir fsync per file
+    # (AETHER_RECOVERY_DEFER_FSYNC=1 leaves that last flush to the OS).
+    writes: List[Tuple[str, Any, int]] = []
     with state_lock:
         prev_energy = AETHER_STATE.get("energy", DEFAULT_STATE.get("energy", 100))
         AETHER_STATE.clear()
@@ -3450,26 +4669,28 @@ def _apply_recovery_payload(payload: Dict[str, Any]) -> None:
         # Preserve energy to avoid unintended budget shifts during recovery.
         AETHER_STATE["energy"] = prev_energy
         AETHER_STATE["version"] = AETHER_VERSION
-        save_json_atomic(STATE_FILE, AETHER_STATE)
+        writes.append((STATE_FILE, dict(AETHER_STATE), next(_write_seq)))
 
     with memory_lock:
         AETHER_MEMORY.clear()
         if isinstance(mem, list):
             AETHER_MEMORY.extend(mem)
-        save_json_atomic(MEMORY_FILE, AETHER_MEMORY)
+        _jsonl_reset(MEMORY_LOG_FILE)
+        writes.append((MEMORY_FILE, list(AETHER_MEMORY), next(_write_seq)))
 
     with strategic_lock:
         STRATEGIC_MEMORY.clear()
         STRATEGIC_MEMORY.update(
             strat if isinstance(strat, dict) else {"patterns": {}, "failures": {}, "history": [], "last_update": None}
         )
-        save_json_atomic(STRATEGIC_FILE, STRATEGIC_MEMORY)
+        writes.append((STRATEGIC_FILE, dict(STRATEGIC_MEMORY), next(_write_seq)))
 
     with log_lock:
         AETHER_LOGS.clear()
         if isinstance(logs, list):
             AETHER_LOGS.extend(logs)
-        save_json_atomic(LOG_FILE, AETHER_LOGS)
+        _jsonl_reset(LOGS_LOG_FILE)
+        writes.append((LOG_FILE, list(AETHER_LOGS), next(_write_seq)))
 
     with projects_lock:
         AETHER_PROJECTS.clear()
@@ -3477,14 +4698,23 @@ def _apply_recovery_payload(payload: Dict[str, Any]) -> None:
             AETHER_PROJECTS.extend(projects)
         else:
             AETHER_PROJECTS.extend(list(DEFAULT_PROJECTS))
-        save_json_atomic(PROJECTS_FILE, AETHER_PROJECTS)
+        _jsonl_reset(PROJECTS_LOG_FILE)
+        writes.append((PROJECTS_FILE, list(AETHER_PROJECTS), next(_write_seq)))
 
     with tasks_lock:
         AETHER_TASKS.clear()
         if isinstance(tasks, list):
             AETHER_TASKS.extend(tasks)
         _normalize_tasks_locked()
-        save_json_atomic(TASKS_FILE, AETHER_TASKS)
+        _jsonl_reset(TASKS_LOG_FILE)
+        writes.append((TASKS_FILE, list(AETHER_TASKS), next(_write_seq)))
+
+    save_json_atomic_batch(writes, sync_dirs=False)
+    if not AETHER_RECOVERY_DEFER_FSYNC and hasattr(os, "sync"):
+        try:
+            os.sync()
+        except Exception:
+            pass
 
 def _mark_recovered_tasks() -> int:
     recovered = 0
@@ -3492,7 +4722,7 @@ def _mark_recovered_tasks() -> int:
         for task in AETHER_TASKS:
             if task.get("status") == "RUNNING":
                 # Preserve retry_count/metadata; only update status for safety.
-                task["status"] = "RECOVERED"
+                _set_task_status_locked(task, "RECOVERED")
                 recovered += 1
         if recovered:
             save_json_atomic(TASKS_FILE, AETHER_TASKS)
@@ -3528,7 +4758,23 @@ def crash_recovery_brain() -> Dict[str, Any]:
 # UI HELPERS
 # -----------------------------
 
+# Cached payload keyed on (STATUS_VERSION, queue size). STATUS_VERSION is bumped by
+# persisted/dirty writes, STATUS_EVENT_TYPES log events and throttle changes; the age cap (a few UI timer
+# ticks) refreshes the purely time-derived fields (error windows aging out).
+UI_STATUS_MAX_AGE_SEC = float(os.environ.get("AETHER_UI_STATUS_MAX_AGE_SEC", "15"))
+_UI_STATUS_CACHE: Dict[str, Any] = {"key": None, "ts": 0.0, "payload": ""}
+
 def ui_status() -> str:
+    key = (STATUS_VERSION[0], task_queue_size())
+    cache = _UI_STATUS_CACHE
+    if cache["key"] == key and (time.monotonic() - cache["ts"]) < UI_STATUS_MAX_AGE_SEC:
+        return cache["payload"]
+    payload = _build_ui_status()
+    # key taken before building: a change during the build forces a rebuild next call
+    _UI_STATUS_CACHE.update({"key": key, "ts": time.monotonic(), "payload": payload})
+    return payload
+
+def _build_ui_status() -> str:
     with state_lock:
         s = dict(AETHER_STATE)
     with modules_lock:
@@ -3562,10 +4808,10 @@ def ui_status() -> str:
     diagnosis_summary = _diagnosis_summary(diagnosis)
     stability = evaluate_stability()
     snapshots = snapshot_list()
-    return json.dumps(
+    return _json_dumps_pretty(
         {
             "state": s,
-            "queue_size": TASK_QUEUE.qsize(),
+            "queue_size": task_queue_size(),
             "memory_len": len(AETHER_MEMORY),
             "strategic": st,
             "kill_switch": KILL_SWITCH,
@@ -3600,13 +4846,11 @@ def ui_status() -> str:
                 "since": stability.get("since"),
             },
         },
-        indent=2,
-        ensure_ascii=False,
     )
 
 def ui_enqueue(cmd: str, prio: int) -> Tuple[str, str]:
     r = enqueue_task(cmd, int(prio), source="ui", origin="ui_enqueue")
-    status_text = f"ENQUEUE_RESULT={json.dumps(r, ensure_ascii=False)}\n\n{ui_status()}"
+    status_text = f"ENQUEUE_RESULT={_json_dumps_line(r)}\n\n{ui_status()}"
     return status_text, ui_tail_logs()
 
 def ui_reload_modules() -> str:
@@ -3619,46 +4863,102 @@ def ui_tail_logs(n: int = 50) -> str:
     except Exception:
         n = 50
     with log_lock:
-        tail = AETHER_LOGS[-n:]
-    return "\n".join(json.dumps(x, ensure_ascii=False) for x in tail)
+        size = len(AETHER_LOGS)
+        # same window as list[-n:] (n <= 0 included)
+        start = max(0, size - n) if n > 0 else min(size, -n)
+        tail = list(itertools.islice(AETHER_LOGS, start, size))
+    if orjson is not None:
+        try:
+            return b"\n".join(orjson.dumps(x, option=orjson.OPT_NON_STR_KEYS) for x in tail).decode("utf-8")
+        except TypeError:
+            pass
+    return "\n".join(map(_COMPACT_ENCODE, tail))
 
 def ui_tick(logs_n: int = 50) -> Tuple[str, str]:
     return ui_status(), ui_tail_logs(logs_n)
 
+def ui_tick_changed(logs_n: int, last: Any) -> Tuple[Any, Any, Dict[str, int]]:
+    # Timer tick per session: send status/logs only when their text changed since this
+    # session's last tick (gr.skip() leaves the component as it is on the client).
+    status_txt, logs_txt = ui_tick(logs_n)
+    prev = last if isinstance(last, dict) else {}
+    seen = {"status": hash(status_txt), "logs": hash(logs_txt)}
+    return (
+        gr.skip() if prev.get("status") == seen["status"] else status_txt,
+        gr.skip() if prev.get("logs") == seen["logs"] else logs_txt,
+        seen,
+    )
+
 def ui_snapshot_list() -> str:
-    return json.dumps({"snapshots": snapshot_list()}, indent=2, ensure_ascii=False)
+    snapshot_flush()
+    out: Dict[str, Any] = {"snapshots": snapshot_list()}
+    with _snap_pending_lock:
+        if SNAPSHOT_FAILURES:
+            out["failed"] = dict(SNAPSHOT_FAILURES)
+    return _json_dumps_pretty(out)
 
 def ui_snapshot_create(name: str) -> str:
-    return json.dumps(snapshot_create(name), indent=2, ensure_ascii=False)
+    return _json_dumps_pretty(snapshot_create(name, wait=False))
 
 def ui_snapshot_restore(name: str) -> str:
-    return json.dumps(snapshot_restore(name), indent=2, ensure_ascii=False)
+    return _json_dumps_pretty(snapshot_restore(name))
 
 def ui_snapshot_export(name: str) -> str:
     return snapshot_export(name)
 
 def ui_snapshot_import(txt: str) -> str:
-    return json.dumps(snapshot_import(txt), indent=2, ensure_ascii=False)
+    return _json_dumps_pretty(snapshot_import(txt))
 
 def ui_replica_export(name: str) -> str:
     return replica_export(name or "replica")
 
 def ui_replica_import(txt: str) -> str:
     res = replica_import(txt, apply_now=True)
-    return json.dumps(res, indent=2, ensure_ascii=False)
+    return _json_dumps_pretty(res)
+
+# Dropdown choices are rebuilt by every connecting client / refresh click. Reuse them
+# while nothing was persisted (STATUS_VERSION) and for at most UI_CHOICES_TTL_SEC;
+# ui_add_project / ui_add_task drop the cache explicitly.
+UI_CHOICES_TTL_SEC = 2.0
+_UI_CHOICES_CACHE: Dict[Any, Tuple[float, int, Any]] = {}
+_ui_choices_lock = threading.Lock()
+
+def _cached_choices(key: Any, build):
+    now_m = time.monotonic()
+    version = STATUS_VERSION[0]
+    with _ui_choices_lock:
+        hit = _UI_CHOICES_CACHE.get(key)
+        if hit is not None and hit[0] > now_m and hit[1] == version:
+            return hit[2]
+    value = build()
+    with _ui_choices_lock:
+        if len(_UI_CHOICES_CACHE) >= 64:
+            _UI_CHOICES_CACHE.clear()
+        _UI_CHOICES_CACHE[key] = (now_m + UI_CHOICES_TTL_SEC, version, value)
+    return value
+
+def _invalidate_choices() -> None:
+    with _ui_choices_lock:
+        _UI_CHOICES_CACHE.clear()
 
 def _project_choices():
+    return _cached_choices("projects", _build_project_choices)
+
+def _build_project_choices():
     projects = list_projects()
     return [(p.get("name", p.get("id")), p.get("id")) for p in projects if p.get("id")]
 
 def _default_project_value():
-    for _, pid in _project_choices():
+    choices = _project_choices()
+    for _, pid in choices:
         if pid == "default":
             return pid
-    choices = _project_choices()
     return choices[0][1] if choices else None
 
 def _task_choices(project_id: str):
+    return _cached_choices(("tasks", project_id), lambda: _build_task_choices(project_id))
+
+def _build_task_choices(project_id: str):
     tasks = list_tasks(project_id)
     out = []
     for t in tasks:
@@ -3681,17 +4981,19 @@ def ui_refresh_tasks(project_id):
 
 def ui_add_project(name):
     res = add_project(name)
-    return json.dumps(res, indent=2, ensure_ascii=False), gr.update(choices=_project_choices(), value=_default_project_value())
+    _invalidate_choices()
+    return _json_dumps_pretty(res), gr.update(choices=_project_choices(), value=_default_project_value())
 
 def ui_add_task(project_id, command):
     res = add_task(project_id, command)
+    _invalidate_choices()
     choices = _task_choices(project_id)
     value = choices[0][1] if choices else None
-    return json.dumps(res, indent=2, ensure_ascii=False), gr.update(choices=choices, value=value)
+    return _json_dumps_pretty(res), gr.update(choices=choices, value=value)
 
 def ui_run_task(task_id):
     res = run_project_task(task_id)
-    return json.dumps(res, indent=2, ensure_ascii=False)
+    return _json_dumps_pretty(res)
 
 # -----------------------------
 # CHAT HELPERS (messages history)
@@ -3712,36 +5014,54 @@ def format_reply(decision: Dict[str, Any], result: Dict[str, Any]) -> str:
         return f"⛔ Error: {result.get('error', 'unknown_error')}"
     mode = (decision or {}).get("mode", "general")
     if mode == "planner":
-        payload = json.dumps(result.get("result"), indent=2, ensure_ascii=False)
+        payload = _json_dumps_pretty(result.get("result"))
         return f"🧭 Esquema propuesto (no ejecutado):\n\n{payload}"
     if mode == "ai_module":
         mod = result.get("module") or "ai_module"
-        payload = json.dumps(result.get("result"), indent=2, ensure_ascii=False)
+        payload = _json_dumps_pretty(result.get("result"))
         return f"🧩 Plugin: {mod}\n\n{payload}"
     if mode == "scientific":
-        payload = json.dumps(result.get("result"), indent=2, ensure_ascii=False)
+        payload = _json_dumps_pretty(result.get("result"))
         return f"🔬 Resultado científico:\n\n{payload}"
     val = result.get("result")
     if isinstance(val, (dict, list)):
-        return json.dumps(val, indent=2, ensure_ascii=False)
+        return _json_dumps_pretty(val)
     return str(val)
 
+_ROLES = frozenset(("user", "assistant"))
+
+class _NormalizedList(list):
+    # Marker: every item is already a validated {"role", "content"} message.
+    __slots__ = ()
+
 def _normalize_history_messages(history: Any) -> List[Dict[str, str]]:
+    if isinstance(history, _NormalizedList):
+        # already validated: shallow copy only (callers append to the result)
+        return _NormalizedList(history)
     if not isinstance(history, list):
         return []
-    messages: List[Dict[str, str]] = []
+    _str = str
+    # Fast path: messages format only (the gradio "messages" chatbot never sends pairs).
+    if not any(isinstance(item, (list, tuple)) for item in history):
+        return _NormalizedList(
+            {"role": r, "content": c}
+            for item in history
+            if isinstance(item, dict)
+            for r, c in ((item.get("role"), item.get("content")),)
+            if isinstance(r, _str) and r in _ROLES and isinstance(c, _str)
+        )
+    messages: List[Dict[str, str]] = _NormalizedList()
     for item in history:
         if isinstance(item, dict):
             role = item.get("role")
             content = item.get("content")
-            if isinstance(role, str) and isinstance(content, str):
-                if role in {"user", "assistant"}:
-                    messages.append({"role": role, "content": content})
+            if isinstance(role, _str) and role in _ROLES and isinstance(content, _str):
+                messages.append({"role": role, "content": content})
         elif isinstance(item, (list, tuple)) and len(item) == 2:
             user_text, bot_text = item
-            if isinstance(user_text, str):
+            if isinstance(user_text, _str):
                 messages.append({"role": "user", "content": user_text})
-            if isinstance(bot_text, str):
+            if isinstance(bot_text, _str):
                 messages.append({"role": "assistant", "content": bot_text})
     return messages
 
@@ -3749,14 +5069,67 @@ def _safe_read_json(path: str, default: Any) -> Any:
     try:
         if not os.path.exists(path):
             return default
-        with open(path, "r", encoding="utf-8") as handle:
-            return json.load(handle)
+        # one read + parse from the buffer (no TextIOWrapper decode loop)
+        with open(path, "rb") as handle:
+            return _json_loads(handle.read())
     except Exception:
         return default
 
+# Chats are not critical state: fsync only on request.
+AETHER_FSYNC_CHAT = os.environ.get("AETHER_FSYNC_CHAT", "0") == "1"
+
+def _atomic_write_bytes(path: str, data: bytes) -> None:
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                n = os.write(fd, view)
+                view = view[n:]
+            if AETHER_FSYNC_CHAT:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.remove(tmp)
+        except Exception:
+            pass
+        raise
+
+def _safe_write_json(path: str, payload: Any) -> None:
+    # encode once to bytes -> tmp file -> os.replace (a crash never leaves half a chat)
+    data = None
+    if orjson is not None:
+        try:
+            data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            data = None
+    if data is None:
+        data = _UI_ENCODE(payload).encode("utf-8")
+    try:
+        _atomic_write_bytes(path, data)
+    except FileNotFoundError:
+        # UI dir removed after startup (tmp cleaner): recreate once and retry
+        _ensure_ui_dir(force=True)
+        _atomic_write_bytes(path, data)
+
+# UI_DATA_DIR is created once (start_aether / first chat helper), not per call.
+_UI_DIR_READY = False
+
+def _ensure_ui_dir(force: bool = False) -> None:
+    global _UI_DIR_READY
+    if _UI_DIR_READY and not force:
+        return
+    os.makedirs(UI_DATA_DIR, exist_ok=True)
+    _UI_DIR_READY = True
+
 def load_chat(view: str) -> List[Dict[str, str]]:
     try:
-        os.makedirs(UI_DATA_DIR, exist_ok=True)
+        if not _UI_DIR_READY:
+            _ensure_ui_dir()
         path = os.path.join(UI_DATA_DIR, f"{view}_chat.json")
         payload = _safe_read_json(path, [])
         return _normalize_history_messages(payload)
@@ -3765,36 +5138,85 @@ def load_chat(view: str) -> List[Dict[str, str]]:
 
 def save_chat(view: str, history: Any) -> None:
     try:
-        os.makedirs(UI_DATA_DIR, exist_ok=True)
+        if not _UI_DIR_READY:
+            _ensure_ui_dir()
         path = os.path.join(UI_DATA_DIR, f"{view}_chat.json")
-        payload = _normalize_history_messages(history)
-        with open(path, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
+        _safe_write_json(path, _normalize_history_messages(history))
     except Exception:
         return
 
 def load_active(view: str) -> List[Dict[str, str]]:
+    with _active_save_lock:
+        pending = _PENDING_ACTIVE.get(view)
+    if pending is not None:
+        # not flushed yet: the pending history is newer than the file
+        return _normalize_history_messages(pending)
     try:
-        os.makedirs(UI_DATA_DIR, exist_ok=True)
+        if not _UI_DIR_READY:
+            _ensure_ui_dir()
         path = os.path.join(UI_DATA_DIR, f"{view}_active.json")
         payload = _safe_read_json(path, [])
         return _normalize_history_messages(payload)
     except Exception:
         return []
 
+# save_active is debounced: chat turns only record the latest history per view and a
+# single writer thread persists it at most once per ACTIVE_SAVE_DEBOUNCE_SEC.
+ACTIVE_SAVE_DEBOUNCE_SEC = 0.25
+_PENDING_ACTIVE: Dict[str, Any] = {}
+_active_save_lock = threading.Lock()
+_active_flush_lock = threading.Lock()
+_active_save_event = threading.Event()
+_active_save_state: Dict[str, Any] = {"thread": None}
+
+def _active_save_loop() -> None:
+    while True:
+        _active_save_event.wait()
+        # let a burst of turns collapse into one write
+        time.sleep(ACTIVE_SAVE_DEBOUNCE_SEC)
+        _active_save_event.clear()
+        flush_active_saves()
+
+def flush_active_saves() -> None:
+    # One flusher at a time (writer thread vs atexit), so a view's writes land in order.
+    # Entries stay pending until written: load_active must not fall back to the old file.
+    with _active_flush_lock:
+        with _active_save_lock:
+            items = list(_PENDING_ACTIVE.items())
+        for view, history in items:
+            _write_active(view, history)
+            with _active_save_lock:
+                if _PENDING_ACTIVE.get(view) is history:
+                    del _PENDING_ACTIVE[view]
+
+atexit.register(flush_active_saves)
+
 def save_active(view: str, history: Any) -> None:
+    # always a private copy: chat handlers keep appending to the session list in place
+    history = _normalize_history_messages(history)
+    with _active_save_lock:
+        _PENDING_ACTIVE[view] = history
+        th = _active_save_state.get("thread")
+        if th is None or not th.is_alive():
+            th = threading.Thread(target=_active_save_loop, daemon=True)
+            _active_save_state["thread"] = th
+            th.start()
+    _active_save_event.set()
+
+def _write_active(view: str, history: Any) -> None:
     try:
-        os.makedirs(UI_DATA_DIR, exist_ok=True)
+        if not _UI_DIR_READY:
+            _ensure_ui_dir()
         path = os.path.join(UI_DATA_DIR, f"{view}_active.json")
-        payload = _normalize_history_messages(history)
-        with open(path, "w", encoding="utf-8") as handle:
-            json.dump(payload, handle, ensure_ascii=False, indent=2)
+        # normalized by save_active
+        _safe_write_json(path, history)
     except Exception:
         return
 
 def load_chats(view: str) -> List[Dict[str, Any]]:
     try:
-        os.makedirs(UI_DATA_DIR, exist_ok=True)
+        if not _UI_DIR_READY:
+            _ensure_ui_dir()
         path = os.path.join(UI_DATA_DIR, f"{view}_chats.json")
         payload = _safe_read_json(path, [])
         if not isinstance(payload, list):
@@ -3823,13 +5245,17 @@ def load_chats(view: str) -> List[Dict[str, Any]]:
 
 def save_chats(view: str, chats: List[Dict[str, Any]]) -> None:
     try:
-        os.makedirs(UI_DATA_DIR, exist_ok=True)
+        if not _UI_DIR_READY:
+            _ensure_ui_dir()
         path = os.path.join(UI_DATA_DIR, f"{view}_chats.json")
         safe_payload: List[Dict[str, Any]] = []
         for item in chats:
             if not isinstance(item, dict):
                 continue
-            history = _normalize_history_messages(item.get("history"))
+            history = item.get("history")
+            if not isinstance(history, _NormalizedList):
+                # chats loaded via load_chats are already normalized: only re-scan foreign lists
+                history = _normalize_history_messages(history)
             chat_id = item.get("id")
             title = item.get("title")
             ts = item.get("ts")
@@ -3843,33 +5269,74 @@ def save_chats(view: str, chats: List[Dict[str, Any]]) -> None:
                         "hash": item.get("hash"),
                     }
                 )
-        with open(path, "w", encoding="utf-8") as handle:
-            json.dump(safe_payload, handle, ensure_ascii=False, indent=2)
+        _safe_write_json(path, safe_payload)
     except Exception:
         return
 
+def _history_hash(messages: List[Dict[str, str]]) -> str:
+    # Normalized messages are built in code with a fixed {role, content} key order, so no
+    # sort_keys pass is needed; hash the encoded bytes directly.
+    if orjson is not None:
+        raw = orjson.dumps(messages)
+    else:
+        raw = _COMPACT_ENCODE(messages).encode("utf-8")
+    return hashlib.sha256(raw).hexdigest()
+
 def _snapshot_title() -> str:
     return f"Proyecto {datetime.now().strftime('%Y-%m-%d %H:%M')}"
 
-def snapshot_current_to_list(view: str, history: Any, chats: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+# Chat ids are UI-only (not security tokens): low 16 bits of the clock + a counter with
+# a random start, no urandom read per snapshot.
+_CHAT_ID_COUNTER = itertools.count(random.randint(0, 0xFFFF))
+
+def _new_chat_id(chat_list: List[Dict[str, Any]]) -> str:
+    taken = {item.get("id") for item in chat_list}
+    while True:
+        chat_id = f"{int(time.time()) & 0xFFFF:04x}{next(_CHAT_ID_COUNTER) & 0xFFFF:04x}"
+        if chat_id not in taken:
+            return chat_id
+
+def _commit_snapshot(
+    view: str, history: Any, chats: Optional[List[Dict[str, Any]]]
+) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
+    # Single pipeline: normalize once -> hash once -> dedupe -> one write.
+    # Returns (chats, new entry or None when nothing was stored).
     history_messages = _normalize_history_messages(history)
+    chat_list = chats if chats else load_chats(view)
     if not history_messages:
-        return list(chats or load_chats(view))
-    chat_list = list(chats or load_chats(view))
-    history_hash = sha256_text(json.dumps(history_messages, ensure_ascii=False, sort_keys=True))
-    if any(item.get("hash") == history_hash for item in chat_list):
-        return chat_list
-    chat_list.append(
-        {
-            "id": uuid.uuid4().hex[:8],
-            "title": _snapshot_title(),
-            "ts": safe_now(),
-            "history": history_messages,
-            "hash": history_hash,
-        }
-    )
+        # unchanged: hand back the same list so the select handlers' id index stays valid
+        return chat_list, None
+    history_hash = _history_hash(history_messages)
+    # equality fallback: chats saved before the hash format changed (list == checks len first)
+    if any(item.get("hash") == history_hash or item.get("history") == history_messages for item in chat_list):
+        return chat_list, None
+    entry = {
+        "id": _new_chat_id(chat_list),
+        "title": _snapshot_title(),
+        "ts": safe_now(),
+        "history": history_messages,
+        "hash": history_hash,
+    }
+    chat_list = list(chat_list)
+    chat_list.append(entry)
+    # histories loaded or created here are _NormalizedList: save_chats does not re-scan them
     save_chats(view, chat_list)
-    return chat_list
+    return chat_list, entry
+
+def snapshot_current_to_list(view: str, history: Any, chats: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+    return _commit_snapshot(view, history, chats)[0]
+
+# view -> (chats list, len, {id: chat}); the list reference is kept so identity stays meaningful.
+_CHAT_INDEX_BY_VIEW: Dict[str, Tuple[List[Dict[str, Any]], int, Dict[str, Dict[str, Any]]]] = {}
+
+def _chat_by_id(view: str, chats: List[Dict[str, Any]], chat_id: str) -> Optional[Dict[str, Any]]:
+    cached = _CHAT_INDEX_BY_VIEW.get(view)
+    if cached is None or cached[0] is not chats or cached[1] != len(chats):
+        # reversed: on duplicate ids the first chat wins, as with the old linear scan
+        index = {c["id"]: c for c in reversed(chats) if isinstance(c, dict) and isinstance(c.get("id"), str)}
+        cached = (chats, len(chats), index)
+        _CHAT_INDEX_BY_VIEW[view] = cached
+    return cached[2].get(chat_id)
 
 def _chat_choices(chats: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
     choices: List[Tuple[str, str]] = []
@@ -3903,31 +5370,35 @@ def _run_chat_guard(message: str) -> str:
         return format_reply(decision, result)
     except Exception as e:
         category = _classify_chat_error(e)
+        info = {"error": str(e), "type": type(e).__name__, "category": category}
+        if AETHER_DEBUG:
+            info["traceback"] = traceback.format_exc()
         try:
-            log_event(
-                "CHAT_GUARD_ERROR",
-                {
-                    "error": str(e),
-                    "category": category,
-                    "traceback": traceback.format_exc(),
-                },
-            )
+            log_event("CHAT_GUARD_ERROR", info)
         except Exception:
             pass
         return _format_chat_error(category)
 
+def _session_history(history: Any) -> List[Dict[str, str]]:
+    # Handlers append to the result, so it is always a new list: a _NormalizedList (the
+    # type survives gr.State's deepcopy) is copied without re-validating its items;
+    # anything else (plain lists from the client, pairs) is normalized.
+    if isinstance(history, _NormalizedList):
+        return _NormalizedList(history)
+    return _normalize_history_messages(history)
+
 def chat_send(message: str, history: Any):
     message = (message or "").strip()
-    history_messages = _normalize_history_messages(history)
+    history_messages = _session_history(history)
     if not message:
         return history_messages, history_messages, ""
     if message.lower() == "diagnose" or "why are you in safe mode" in message.lower():
-        diagnosis = get_self_diagnosis()
+        diagnosis = get_self_diagnosis(fresh=True)
         try:
             log_event("DIAGNOSE_REQUEST", {"source": "chat"})
         except Exception:
             pass
-        payload = json.dumps(diagnosis, indent=2, ensure_ascii=False)
+        payload = _json_dumps_pretty(diagnosis)
         history_messages.append({"role": "user", "content": message})
         history_messages.append({"role": "assistant", "content": payload})
         return history_messages, history_messages, ""
@@ -3951,7 +5422,7 @@ def _format_plugin_reply(payload: Any) -> str:
     if isinstance(payload, str):
         return payload
     try:
-        return json.dumps(payload, indent=2, ensure_ascii=False)
+        return _json_dumps_pretty(payload)
     except Exception:
         return str(payload)
 
@@ -3981,7 +5452,7 @@ def ui_select_builder_chat(
     updated_chats = snapshot_current_to_list("builder", history, chats)
     if not chat_id:
         return history, history, updated_chats, gr.update(choices=_chat_choices(updated_chats), value=None)
-    selected = next((item for item in updated_chats if item.get("id") == chat_id), None)
+    selected = _chat_by_id("builder", updated_chats, chat_id)
     if not selected:
         return history, history, updated_chats, gr.update(choices=_chat_choices(updated_chats), value=None)
     new_history = _normalize_history_messages(selected.get("history"))
@@ -3994,7 +5465,7 @@ def ui_select_scientific_chat(
     updated_chats = snapshot_current_to_list("scientific", history, chats)
     if not chat_id:
         return history, history, updated_chats, gr.update(choices=_chat_choices(updated_chats), value=None)
-    selected = next((item for item in updated_chats if item.get("id") == chat_id), None)
+    selected = _chat_by_id("scientific", updated_chats, chat_id)
     if not selected:
         return history, history, updated_chats, gr.update(choices=_chat_choices(updated_chats), value=None)
     new_history = _normalize_history_messages(selected.get("history"))
@@ -4003,7 +5474,7 @@ def ui_select_scientific_chat(
 
 def builder_chat_send(message: str, history: Any):
     message = (message or "").strip()
-    history_messages = _normalize_history_messages(history)
+    history_messages = _session_history(history)
     if not message:
         return history_messages, history_messages, ""
     command = f"builder: {message}"
@@ -4019,7 +5490,7 @@ def builder_chat_send(message: str, history: Any):
 
 def scientific_chat_send(message: str, history: Any):
     message = (message or "").strip()
-    history_messages = _normalize_history_messages(history)
+    history_messages = _session_history(history)
     if not message:
         return history_messages, history_messages, ""
     command = f"scientific: {message}"
@@ -4048,6 +5519,7 @@ def start_aether() -> str:
     _STARTED = True
 
     init_state()
+    _ensure_ui_dir()
     ensure_demo1()
     # Level 46: Crash Recovery Brain runs once at startup before any workers.
     crash_recovery_brain()
@@ -4092,7 +5564,9 @@ def start_aether() -> str:
             "orchestrator_policy": dict(ORCHESTRATOR_POLICY),
         },
     )
-    update_dashboard()
+    # Synchronous: the orchestrator autostart merges into the dashboard file right after.
+    DASH_DIRTY.clear()
+    _write_dashboard()
     ensure_orchestrator_autostart(
         orchestrator_obj=ORCHESTRATOR,
         state=AETHER_STATE,
@@ -4106,11 +5580,62 @@ def start_aether() -> str:
 # GRADIO UI (HF SAFE)
 # -----------------------------
 
-def ui_apply_language(lang: str) -> Tuple[Any, ...]:
+# Static header / footer HTML, rendered once per language.
+_HEADER_TMPL = "<div id='aether-header'><div>{beta}</div></div>"
+_HEADER_RENDERED: Dict[str, str] = {
+    code: _HEADER_TMPL.format(beta=t(code, "header_beta")) for code in SUPPORTED_LANGS
+}
+_CONFIG_EMAIL_HTML = "<div style='font-size: 0.85em; color: #666;'>inf.aether@outlook.com</div>"
+
+# The update tuple depends only on the language: build it once per language.
+# Gradio pops "value" from update dicts while postprocessing, so callers get copies.
+_LANG_UPDATE_CACHE: Dict[str, Tuple[Dict[str, Any], ...]] = {}
+
+def _share_updates(updates: Tuple[Dict[str, Any], ...]) -> Tuple[Dict[str, Any], ...]:
+    # identical payloads (new_chat / home_button / send_button across views) -> one dict
+    seen: Dict[Any, Dict[str, Any]] = {}
+    shared = []
+    for upd in updates:
+        try:
+            key = tuple(upd.items())
+            shared.append(seen.setdefault(key, upd))
+        except TypeError:
+            shared.append(upd)
+    return tuple(shared)
+
+def _lang_updates(resolved: str) -> Tuple[Dict[str, Any], ...]:
+    cached = _LANG_UPDATE_CACHE.get(resolved)
+    if cached is None:
+        cached = _LANG_UPDATE_CACHE.setdefault(resolved, _share_updates(_build_lang_updates(resolved)))
+    return cached
+
+# (from_lang, to_lang) -> per-slot "text differs" flags over the cached update tuples.
+_LANG_DIFF_CACHE: Dict[Tuple[str, str], Tuple[bool, ...]] = {}
+
+def _lang_slot_changes(prev: str, resolved: str) -> Tuple[bool, ...]:
+    key = (prev, resolved)
+    changed = _LANG_DIFF_CACHE.get(key)
+    if changed is None:
+        changed = tuple(a != b for a, b in zip(_lang_updates(prev), _lang_updates(resolved)))
+        _LANG_DIFF_CACHE[key] = changed
+    return changed
+
+def ui_apply_language(lang: str, current_lang: Optional[str] = None) -> Tuple[Any, ...]:
+    # current_lang is the session's language_state (what the client shows now): slots
+    # whose payload is the same in both languages are skipped instead of re-sent.
     resolved = normalize_lang(lang)
+    updates = _lang_updates(resolved)
+    if not current_lang or not hasattr(gr, "skip"):
+        return (resolved, *[dict(u) for u in updates])
+    if resolved == current_lang:
+        # change event re-fired with the language already shown: nothing to redo
+        return (resolved, *[gr.skip() for _ in updates])
+    changed = _lang_slot_changes(normalize_lang(current_lang), resolved)
+    return (resolved, *[dict(u) if c else gr.skip() for u, c in zip(updates, changed)])
+
+def _build_lang_updates(resolved: str) -> Tuple[Dict[str, Any], ...]:
     return (
-        resolved,
-        gr.update(value=f"<div id='aether-header'><div>{t(resolved, 'header_beta')}</div></div>"),
+        gr.update(value=_HEADER_RENDERED.get(resolved) or _HEADER_TMPL.format(beta=t(resolved, "header_beta"))),
         gr.update(label=t(resolved, "boot_label")),
         gr.update(value=t(resolved, "new_chat")),
         gr.update(label=t(resolved, "chats")),
@@ -4182,8 +5707,9 @@ def ui_apply_language(lang: str) -> Tuple[Any, ...]:
         gr.update(value=t(resolved, "home_button")),
         gr.update(value=t(resolved, "config_title")),
         gr.update(value=t(resolved, "config_language_title")),
-        gr.update(label=t(resolved, "language_selector_label"), choices=LANGUAGE_CHOICES, value=resolved),
-        gr.update(value="<div style='font-size: 0.85em; color: #666;'>inf.aether@outlook.com</div>"),
+        # choices are fixed at build time; only label/value change with the language
+        gr.update(label=t(resolved, "language_selector_label"), value=resolved),
+        gr.update(value=_CONFIG_EMAIL_HTML),
     )
 
 
@@ -4191,13 +5717,19 @@ def ui_init_language(request: gr.Request) -> Tuple[Any, ...]:
     accept_language = ""
     if request:
         try:
-            accept_language = dict(request.headers).get("accept-language", "")
+            # direct lookup on the headers mapping (no full dict copy)
+            accept_language = request.headers.get("accept-language", "")
         except Exception:
             accept_language = ""
     detected = detect_language_from_header(accept_language)
     return ui_apply_language(detected)
 
-def ui_set_view(view: str) -> Tuple[gr.update, gr.update, gr.update, gr.update, str]:
+def ui_boot(logs_n: int, request: gr.Request) -> Tuple[Any, ...]:
+    # Page load in one round-trip: language, core start, then status/logs of the
+    # started core.
+    return (*ui_init_language(request), start_aether(), ui_status(), ui_tail_logs(logs_n))
+
+def _view_updates(view: str) -> Tuple[gr.update, gr.update, gr.update, gr.update, str]:
     return (
         gr.update(visible=view == "home"),
         gr.update(visible=view == "builder"),
@@ -4206,8 +5738,19 @@ def ui_set_view(view: str) -> Tuple[gr.update, gr.update, gr.update, gr.update,
         view,
     )
 
+# Built once; the payloads only carry "visible" (Gradio pops "value" only), so the
+# same tuple can be handed out on every switch.
+VIEW_UPDATES: Dict[str, Tuple[Any, ...]] = {v: _view_updates(v) for v in ("home", "builder", "scientific", "config")}
+
+def ui_set_view(view: str) -> Tuple[gr.update, gr.update, gr.update, gr.update, str]:
+    cached = VIEW_UPDATES.get(view)
+    return cached if cached is not None else _view_updates(view)
+
 def build_ui() -> gr.Blocks:
     ensure_projects()
+    # warm the per-language update tuples so the first switch is a copy only
+    for lang in SUPPORTED_LANGS:
+        _lang_updates(lang)
     with gr.Blocks(
         title=t("es", "app_title"),
         css="""
@@ -4221,16 +5764,21 @@ def build_ui() -> gr.Blocks:
     ) as demo:
         view_state = gr.State("home")
         language_state = gr.State("es")
-        builder_initial_history = load_active("builder")
-        scientific_initial_history = load_active("scientific")
-        builder_saved_chats = load_chats("builder")
-        scientific_saved_chats = load_chats("scientific")
+        # four independent file reads: run them side by side
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            builder_initial_history, scientific_initial_history, builder_saved_chats, scientific_saved_chats = [
+                fut.result()
+                for fut in (
+                    pool.submit(load_active, "builder"),
+                    pool.submit(load_active, "scientific"),
+                    pool.submit(load_chats, "builder"),
+                    pool.submit(load_chats, "scientific"),
+                )
+            ]
 
         with gr.Row():
             with gr.Column(scale=1, min_width=160):
-                header_html = gr.HTML(
-                    f"<div id='aether-header'><div>{t('es', 'header_beta')}</div></div>"
-                )
+                header_html = gr.HTML(_HEADER_RENDERED["es"])
             with gr.Column(scale=1, min_width=120):
                 btn_open_config = gr.Button("⚙️", size="sm", elem_id="aether-gear")
 
@@ -4409,11 +5957,9 @@ def build_ui() -> gr.Blocks:
                 value="es",
             )
             gr.Markdown("---")
-            config_email_html = gr.HTML(
-                "<div style='font-size: 0.85em; color: #666;'>inf.aether@outlook.com</div>"
-            )
+            config_email_html = gr.HTML(_CONFIG_EMAIL_HTML)
 
-        language_outputs = [
+        language_outputs = (
             language_state,
             header_html,
             boot_msg,
@@ -4489,7 +6035,9 @@ def build_ui() -> gr.Blocks:
             config_language_md,
             language_selector,
             config_email_html,
-        ]
+        )
+        # positional contract with ui_apply_language: drift must fail here, not mis-map
+        assert len(language_outputs) == 1 + len(_lang_updates("es")), "language_outputs out of sync"
 
         # wiring
         btn_send.click(fn=chat_send, inputs=[user_msg, chat_state], outputs=[chat, chat_state, user_msg])
@@ -4554,59 +6102,65 @@ def build_ui() -> gr.Blocks:
 
         language_selector.change(
             fn=ui_apply_language,
-            inputs=[language_selector],
+            inputs=[language_selector, language_state],
             outputs=language_outputs,
         )
 
         btn_open_config.click(
-            fn=lambda: ui_set_view("config"),
+            fn=functools.partial(ui_set_view, "config"),
             inputs=[],
             outputs=[home_view, builder_view, scientific_view, config_view, view_state],
         )
         btn_builder.click(
-            fn=lambda: ui_set_view("builder"),
+            fn=functools.partial(ui_set_view, "builder"),
             inputs=[],
             outputs=[home_view, builder_view, scientific_view, config_view, view_state],
         )
         btn_scientific.click(
-            fn=lambda: ui_set_view("scientific"),
+            fn=functools.partial(ui_set_view, "scientific"),
             inputs=[],
             outputs=[home_view, builder_view, scientific_view, config_view, view_state],
         )
         btn_home_from_builder.click(
-            fn=lambda: ui_set_view("home"),
+            fn=functools.partial(ui_set_view, "home"),
             inputs=[],
             outputs=[home_view, builder_view, scientific_view, config_view, view_state],
         )
         btn_home_from_scientific.click(
-            fn=lambda: ui_set_view("home"),
+            fn=functools.partial(ui_set_view, "home"),
             inputs=[],
             outputs=[home_view, builder_view, scientific_view, config_view, view_state],
         )
         btn_home_from_config.click(
-            fn=lambda: ui_set_view("home"),
+            fn=functools.partial(ui_set_view, "home"),
             inputs=[],
             outputs=[home_view, builder_view, scientific_view, config_view, view_state],
         )
 
         # boot (solo una vez)
-        demo.load(fn=ui_init_language, inputs=[], outputs=language_outputs)
-        demo.load(fn=start_aether, inputs=[], outputs=[boot_msg])
-        demo.load(fn=ui_status, inputs=[], outputs=[status])
-        demo.load(fn=ui_tail_logs, inputs=[logs_n], outputs=[logs])
+        demo.load(fn=ui_boot, inputs=[logs_n], outputs=language_outputs + (boot_msg, status, logs))
 
         if hasattr(gr, "Timer"):
             ticker = gr.Timer(5)
-            ticker.tick(fn=ui_tick, inputs=[logs_n], outputs=[status, logs])
+            if hasattr(gr, "skip"):
+                tick_seen = gr.State({})
+                ticker.tick(fn=ui_tick_changed, inputs=[logs_n, tick_seen], outputs=[status, logs, tick_seen])
+            else:
+                ticker.tick(fn=ui_tick, inputs=[logs_n], outputs=[status, logs])
     return demo
 
 _DEMO: Optional[gr.Blocks] = None
 
+_DEMO_LOCK = threading.Lock()
+
 def get_demo() -> gr.Blocks:
     global _DEMO
     if _DEMO is None:
-        init_state()
-        _DEMO = build_ui()
+        # double-checked: concurrent first callers build the Blocks only once
+        with _DEMO_LOCK:
+            if _DEMO is None:
+                init_state()
+                _DEMO = build_ui()
     return _DEMO
 
 def __getattr__(name: str):
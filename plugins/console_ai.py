@@ -28,6 +28,31 @@ def _load_json(path: str) -> Tuple[bool, Any, str]:
         return False, None, f"unable to read {path}: {exc}"
 
 
+def _load_jsonl(path: str) -> list:
+    entries = []
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # truncated tail line
+                if isinstance(item, dict):
+                    entries.append(item)
+    except OSError:
+        pass
+    return entries
+
+
+def _entry_key(entry: Any) -> Any:
+    if isinstance(entry, dict) and entry.get("seq"):
+        return entry["seq"]
+    return json.dumps(entry, sort_keys=True, default=str)
+
+
 def _data_dir() -> str:
     return os.getenv("AETHER_DATA_DIR", "/tmp/aether")
 
@@ -69,6 +94,16 @@ def _logs(command: str) -> dict:
     if not isinstance(data, list):
         return {"ok": False, "error": f"log file is not a list: {log_path}"}
 
+    # newer events live in the JSONL journal (.old during rotation) until compaction
+    seen = {_entry_key(entry) for entry in data}
+    for path in (log_path + ".log.old", log_path + ".log"):
+        for entry in _load_jsonl(path):
+            key = _entry_key(entry)
+            if key in seen:
+                continue
+            seen.add(key)
+            data.append(entry)
+
     return {"ok": True, "entries": data[-count:]}
 
 
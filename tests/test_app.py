@@ -0,0 +1,369 @@
+import hashlib
+import importlib
+import json
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+_APP_DATA_DIR = tempfile.mkdtemp(prefix="aether-test-")
+
+
+def _load_app():
+    # app reads AETHER_DATA_DIR at import time: every test shares one data dir
+    os.environ["AETHER_DATA_DIR"] = _APP_DATA_DIR
+    os.environ["AETHER_ALLOW_NETWORK"] = "0"
+    module = importlib.import_module("app")
+    module.init_state()
+    return module
+
+
+def test_async_writes_keep_sequence_order():
+    app = _load_app()
+    path = os.path.join(_APP_DATA_DIR, "seq_order.json")
+    newer = next(app._write_seq) + 1000
+    assert app.save_json_atomic(path, {"v": "new"}, _seq=newer)
+    # an older payload never replaces a newer one
+    assert app.save_json_atomic(path, {"v": "old"}, _seq=newer - 1)
+    with open(path, "r", encoding="utf-8") as handle:
+        assert json.load(handle) == {"v": "new"}
+
+    queued = os.path.join(_APP_DATA_DIR, "seq_queue.json")
+    for i in range(5):
+        app.save_json_atomic_async(queued, {"v": i})
+    assert app.flush_pending_writes()
+    # coalesced queue writes land the last payload
+    with open(queued, "r", encoding="utf-8") as handle:
+        assert json.load(handle) == {"v": 4}
+
+
+def test_throttle_cache_invalidated_by_new_errors():
+    app = _load_app()
+    for _ in range(3):
+        app.update_throttle_state()
+    assert app._THROTTLE_CACHE is not None, "settled controller should cache its inputs"
+    app.log_event("WORKER_ERROR", {"error": "test"})
+    app.update_throttle_state()
+    assert any(r.startswith("errors_last_") for r in app.THROTTLE_STATE.get("reasons", []))
+
+
+def test_replica_roundtrip():
+    app = _load_app()
+    exported = app.replica_export("roundtrip")
+    assert app.replica_import(exported, apply_now=False) == {"ok": True, "applied": False}
+
+    # stdlib-serialized replicas verify too (no orjson on the exporting node)
+    saved_orjson = app.orjson
+    app.orjson = None
+    try:
+        exported_stdlib = app.replica_export("roundtrip")
+    finally:
+        app.orjson = saved_orjson
+    assert app.replica_import(exported_stdlib, apply_now=False)["ok"]
+
+
+def test_replica_checksum_covers_serialized_payload():
+    app = _load_app()
+    payload = json.loads(app.replica_export("checksum"))
+    checksum = payload.pop("checksum_sha256")
+    assert checksum == hashlib.sha256(app._json_dumps_pretty_bytes(payload, sort_keys=True)).hexdigest()
+
+    payload["checksum_sha256"] = checksum
+    payload["name"] = "tampered"
+    assert app.replica_import(json.dumps(payload), apply_now=False)["error"] == "checksum_mismatch"
+
+
+def test_replica_checksum_field_names_the_algorithm():
+    app = _load_app()
+    payload = json.loads(app.replica_export("tagged"))
+    algo = app.REPLICA_CHECKSUM_ALGO
+    assert "checksum_" + algo in payload
+    # a digest filed under the other algorithm's field never verifies
+    other = "sha256" if algo == "blake3" else "blake3"
+    payload["checksum_" + other] = payload.pop("checksum_" + algo)
+    res = app.replica_import(json.dumps(payload), apply_now=False)
+    if other == "blake3" and app.blake3 is None:
+        assert res["error"] == "checksum_algo_unavailable"
+    else:
+        assert res["error"] == "checksum_mismatch"
+
+
+def test_task_heap_fifo_for_equal_priority():
+    app = _load_app()
+    commands = [f"revisar orden {i}" for i in range(4)]
+    for command in commands:
+        res = app.enqueue_task(command, 5, source="ui", origin="test")
+        assert res.get("ok"), res
+    popped = []
+    while True:
+        task = app._task_heap_pop()
+        if task is None:
+            break
+        popped.append(task["command"])
+        with app.queue_lock:
+            app.QUEUE_SET.discard(app._cmd_key(task["command"]))
+    assert [c for c in popped if c in commands] == commands
+
+
+def test_session_history_returns_new_list():
+    app = _load_app()
+    normalized = app._normalize_history_messages([{"role": "user", "content": "hola"}])
+    assert isinstance(normalized, app._NormalizedList)
+
+    history = app._session_history(normalized)
+    assert history == normalized
+    assert history is not normalized, "session list must not be mutated in place"
+    history.append({"role": "assistant", "content": "x"})
+    assert len(normalized) == 1
+
+    # plain lists (e.g. State content that lost the subclass) are validated again
+    plain = [{"role": "user", "content": "hola"}, {"role": "bogus", "content": "y"}, ["a", "b"]]
+    history = app._session_history(plain)
+    assert isinstance(history, app._NormalizedList)
+    assert history == [
+        {"role": "user", "content": "hola"},
+        {"role": "user", "content": "a"},
+        {"role": "assistant", "content": "b"},
+    ]
+
+
+def test_chat_send_does_not_mutate_input_history():
+    app = _load_app()
+    history, _, _ = app.builder_chat_send("hola", [])
+    before = list(history)
+    new_history, _, _ = app.builder_chat_send("otra vez", history)
+    assert history == before
+    assert len(new_history) == len(before) + 2
+
+
+def _run_app_script(data_dir: str, body: str, **extra_env: str) -> str:
+    # fresh interpreter: module state is rebuilt from disk as on a real restart
+    script = (
+        "import os, sys, warnings\n"
+        "warnings.filterwarnings('ignore')\n"
+        f"sys.path.insert(0, {str(REPO_ROOT)!r})\n"
+        "import app\n"
+        "app.init_state()\n" + body
+    )
+    env = dict(os.environ, AETHER_DATA_DIR=data_dir, AETHER_ALLOW_NETWORK="0", **extra_env)
+    proc = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout.strip().splitlines()[-1] if proc.stdout.strip() else ""
+
+
+def test_journal_replay_after_restart():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # os._exit skips the atexit flushes: only the JSONL journals hold these entries
+        _run_app_script(
+            temp_dir,
+            "p = app.add_project('journal')['project']['id']\n"
+            "app.add_task(p, 'replayed task')\n"
+            "app.log_event('TEST_REPEAT', {'n': 1})\n"
+            "app.log_event('TEST_REPEAT', {'n': 1})\n"
+            "os._exit(0)\n",
+        )
+        out = _run_app_script(
+            temp_dir,
+            "import json\n"
+            "print(json.dumps({\n"
+            "    'projects': [x.get('name') for x in app.AETHER_PROJECTS],\n"
+            "    'tasks': [x.get('command') for x in app.AETHER_TASKS],\n"
+            "    'repeat': sum(1 for e in app.AETHER_LOGS if e.get('type') == 'TEST_REPEAT'),\n"
+            "}))\n",
+        )
+    state = json.loads(out)
+    assert state["projects"].count("journal") == 1
+    assert state["tasks"].count("replayed task") == 1
+    # identical events are distinct entries (deduped by seq, not content)
+    assert state["repeat"] == 2
+
+
+def test_restore_not_overwritten_by_queued_async_write():
+    app = _load_app()
+    project = app.add_project("restore-race")["project"]["id"]
+    app.add_task(project, "keep me")
+    assert app.flush_pending_writes()
+    assert app.snapshot_create("restore-race")["ok"]
+    expected = [t.get("command") for t in app.AETHER_TASKS]
+
+    gate = threading.Event()
+    real_save = app.save_json_atomic
+    blocker = os.path.join(_APP_DATA_DIR, "blocker.json")
+
+    def _slow_save(path, data, **kwargs):
+        if path == blocker:
+            gate.wait(5)
+        return real_save(path, data, **kwargs)
+
+    app.save_json_atomic = _slow_save
+    try:
+        # park the writer thread, then queue a stale tasks payload behind it
+        app.save_json_atomic_async(blocker, {})
+        time.sleep(0.1)
+        app.save_json_atomic_async(app.TASKS_FILE, [{"id": "stale", "command": "stale task"}])
+        assert app.snapshot_restore("restore-race")["ok"]
+    finally:
+        gate.set()
+        assert app.flush_pending_writes()
+        app.save_json_atomic = real_save
+
+    with open(app.TASKS_FILE, "r", encoding="utf-8") as handle:
+        on_disk = [t.get("command") for t in json.load(handle)]
+    assert on_disk == expected
+
+
+def test_jsonl_compaction_retries_after_failed_base_write():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        out = _run_app_script(
+            temp_dir,
+            "import json\n"
+            "p = app.add_project('compact')['project']['id']\n"
+            "real = app.save_json_atomic\n"
+            "fail = [True]\n"
+            "def flaky(path, data, **kw):\n"
+            "    if path == app.TASKS_FILE and fail[0]:\n"
+            "        return False\n"
+            "    return real(path, data, **kw)\n"
+            "app.save_json_atomic = flaky\n"
+            "for i in range(4):\n"
+            "    app.add_task(p, 'c%d' % i)\n"
+            "app.flush_pending_writes()\n"
+            "stuck = os.path.exists(app.TASKS_LOG_FILE + '.old')\n"
+            "fail[0] = False\n"
+            "for i in range(4, 8):\n"
+            "    app.add_task(p, 'c%d' % i)\n"
+            "app.flush_pending_writes()\n"
+            "print(json.dumps({'stuck': stuck, 'old': os.path.exists(app.TASKS_LOG_FILE + '.old')}))\n"
+            "os._exit(0)\n",
+            AETHER_JSONL_COMPACT_EVERY="3",
+        )
+        state = json.loads(out)
+        # the failed compaction keeps its rotated log; the retry folds it in and removes it
+        assert state == {"stuck": True, "old": False}
+        out = _run_app_script(
+            temp_dir,
+            "import json\n"
+            "print(json.dumps(sorted(t.get('command') for t in app.AETHER_TASKS)))\n",
+        )
+    assert json.loads(out) == [f"c{i}" for i in range(8)]
+
+
+def test_console_logs_include_journal_entries():
+    app = _load_app()
+    from plugins import console_ai
+
+    for i in range(5):
+        app.log_event("TEST_CONSOLE_TAIL", {"i": i})
+    res = console_ai.run("console logs 5")
+    assert res["ok"], res
+    assert [e.get("info", {}).get("i") for e in res["entries"]] == list(range(5))
+
+
+def test_zone_gate_recomputes_from_source():
+    app = _load_app()
+    # a replayed/edited task claiming a wider zone than its source resolves to
+    task = {"id": "forged", "command": "status", "source": "chat", "zone": "INTERNAL", "resolved_zone": "INTERNAL"}
+    ctx = {"command": "status", "task_id": "forged", "task_type": "general", "mode": "normal", "zone": "INTERNAL", "origin": None}
+    failed = app._gate_zone_match(task, ctx)
+    assert failed is not None and failed[0] == "ZONE_MISMATCH"
+    task["source"] = "internal"
+    assert app._gate_zone_match(task, ctx) is None
+
+
+def test_load_active_sees_history_while_it_is_written():
+    app = _load_app()
+    view = "active_" + os.path.basename(_APP_DATA_DIR)
+    app.save_active(view, [{"role": "user", "content": "viejo"}])
+    app.flush_active_saves()
+
+    started = threading.Event()
+    gate = threading.Event()
+    real_write = app._safe_write_json
+
+    def _slow_write(path, data):
+        if path.endswith(f"{view}_active.json"):
+            started.set()
+            gate.wait(5)
+        return real_write(path, data)
+
+    history = [{"role": "user", "content": "nuevo"}]
+    app._safe_write_json = _slow_write
+    try:
+        app.save_active(view, history)
+        assert started.wait(5)
+        # the write is in flight: the pending copy still wins over the old file
+        assert app.load_active(view) == history
+    finally:
+        gate.set()
+        app.flush_active_saves()
+        app._safe_write_json = real_write
+    assert app.load_active(view) == history
+    assert view not in app._PENDING_ACTIVE
+
+
+def test_status_version_bumped_only_by_status_events():
+    app = _load_app()
+    bumps = []
+    real_bump = app._bump_status_version
+    app._jsonl_counts[app.LOGS_LOG_FILE] = 0  # no compaction write during the check
+    app._bump_status_version = lambda: bumps.append(1)
+    try:
+        app.log_event("TEST_STATUS_NOISE", {})
+        assert bumps == []
+        app.log_event("TASK_PERMISSION_DENIED", {"task_id": "x"})
+        assert bumps == [1]
+    finally:
+        app._bump_status_version = real_bump
+
+
+def test_batch_without_dir_sync_still_fsyncs_staged_files():
+    app = _load_app()
+    synced, dirs = [], []
+    real_fsync_path, real_fsync_dir = app._fsync_path, app._fsync_dir
+    app._fsync_path = lambda path: synced.append(path) or True
+    app._fsync_dir = lambda path: dirs.append(path)
+    try:
+        paths = [os.path.join(_APP_DATA_DIR, f"batch_{i}.json") for i in range(2)]
+        assert app.save_json_atomic_batch([(p, {"i": i}) for i, p in enumerate(paths)], sync_dirs=False)
+    finally:
+        app._fsync_path, app._fsync_dir = real_fsync_path, real_fsync_dir
+    # every tmp file is flushed before its rename; only the directory syncs are skipped
+    assert len(synced) == 2 and all(p.endswith(".tmp") for p in synced)
+    assert dirs == []
+
+
+def test_empty_snapshot_index_does_not_hide_new_snapshot():
+    app = _load_app()
+    saved = app.SNAPSHOT_DIR, app.SNAPSHOT_INDEX_FILE
+    snap_dir = tempfile.mkdtemp(prefix="snaps-", dir=_APP_DATA_DIR)
+    app.SNAPSHOT_DIR = snap_dir
+    app.SNAPSHOT_INDEX_FILE = os.path.join(snap_dir, os.path.basename(saved[1]))
+    try:
+        assert app._load_snapshot_index() == []
+        # same second as the empty index: the directory listing must still win
+        with open(os.path.join(snap_dir, "late.json"), "w", encoding="utf-8") as handle:
+            json.dump({"name": "late", "ts": "2026-01-01T00:00:00+00:00", "files": {}}, handle)
+        assert [e["name"] for e in app._load_snapshot_index()] == ["late"]
+    finally:
+        app.SNAPSHOT_DIR, app.SNAPSHOT_INDEX_FILE = saved
+
+
+def test_chat_diagnose_bypasses_diagnosis_cache():
+    app = _load_app()
+    app.get_self_diagnosis()
+    real_diagnose = app.diagnose_system
+    app.diagnose_system = lambda: {"issues": [], "marker": "fresh"}
+    try:
+        # pollers keep the cached result; an explicit request runs a new diagnosis
+        assert app.get_self_diagnosis().get("marker") is None
+        history, _, _ = app.chat_send("diagnose", [])
+        assert json.loads(history[-1]["content"])["marker"] == "fresh"
+    finally:
+        app.diagnose_system = real_diagnose